@@ -1,33 +1,386 @@
 import io
-import pandas as pd
-from datetime import datetime
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+import csv
+import re
+import os
+import logging
+import bisect
+import time
+import threading
+from functools import lru_cache
+from operator import itemgetter
 import numpy as np
+from reportlab import rl_config
+
+# Reports are built programmatically from trusted data, so skip ReportLab's
+# per-attribute shape validation unless GIS_DEBUG is set. Must be set before
+# the platypus imports.
+if not os.environ.get('GIS_DEBUG'):
+    rl_config.shapeChecking = 0
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak, HRFlowable
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch, cm
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=128)
+def _hex(color):
+    # Colors that come from report data (AQI category, score band, USS class)
+    # repeat across reports, so parse each hex string only once.
+    return colors.HexColor(color)
+
+
+# Fixed report colors, parsed once at import.
+_C_INFO_BG_LULC = colors.HexColor('#e3f2fd')
+_C_INFO_BG_AQI = colors.HexColor('#e1f5fe')
+_C_INFO_BG_HEAT = colors.HexColor('#ffebee')
+_C_HEADER_BLUE = colors.HexColor('#1565c0')
+_C_HEADER_LULC_COMPONENTS = colors.HexColor('#4caf50')
+_C_HEADER_INDICES = colors.HexColor('#8bc34a')
+_C_HEADER_CHANGE = colors.HexColor('#ff9800')
+_C_HEADER_WHO = colors.HexColor('#0288d1')
+_C_HEADER_SATELLITE = colors.HexColor('#78909c')
+_C_HEADER_AQI_STATS = colors.HexColor('#4fc3f7')
+_C_HEADER_HEAT_COMPONENTS = colors.HexColor('#ff5722')
+_C_HEADER_HEAT_STATS = colors.HexColor('#ff7043')
+_C_ROW_ALT = colors.HexColor('#f5f5f5')
+_C_INSIGHT_SUBHEADING = colors.HexColor('#455a64')
+_C_INFO_BG_PREDICTIVE = colors.HexColor('#ede7f6')
+_C_HEADER_FORECAST = colors.HexColor('#b39ddb')
+_C_USS_SCORE_BG = colors.HexColor('#f8fafc')
+_C_HEADER_SEISMIC = colors.HexColor('#607d8b')
+_C_SEISMIC_TOTAL_BG = colors.HexColor('#eceff1')
+_C_USS_TITLE = colors.HexColor('#1e3a5f')
+_C_USS_SUBHEADING = colors.HexColor('#2e7d32')
+
+# Static table styles. TableStyle only holds a command list, so a single
+# instance can be shared by every table and report that uses it.
+_LULC_INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _C_INFO_BG_LULC),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+_SCORE_DISPLAY_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('PADDING', (0, 0), (-1, -1), 10),
+])
+_LULC_COMPONENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_LULC_COMPONENTS),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
+])
+_LULC_CLASS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_BLUE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _C_ROW_ALT]),
+])
+_INDEX_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_INDICES),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+])
+_CHANGE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_CHANGE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+])
+_WHO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_WHO),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('PADDING', (0, 0), (-1, -1), 5),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
+])
+_SATELLITE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_SATELLITE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 5),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
+])
+# Static part of the AQI score table; the AQI and compliance score colors
+# depend on the report and are applied on top per call.
+_AQI_SCORE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_BLUE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+    ('FONTSIZE', (0, 1), (0, 1), 14),
+    ('FONTSIZE', (1, 1), (-1, 1), 9),
+    ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+_AQI_STAT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_AQI_STATS),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 5),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+])
+_AQI_INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _C_INFO_BG_AQI),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+])
+_HEAT_INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _C_INFO_BG_HEAT),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+])
+_HEAT_COMPONENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_HEAT_COMPONENTS),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
+])
+_HEAT_STAT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_HEAT_STATS),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+])
+_KEY_VALUE_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+])
+_PREDICTIVE_INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _C_INFO_BG_PREDICTIVE),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+])
+_FORECAST_METRIC_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_FORECAST),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('PADDING', (0, 0), (-1, -1), 6),
+])
+# The USS score box also gets a BOX in the classification color per report.
+_USS_SCORE_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 20),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+])
+_USS_MODULE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_BLUE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _C_ROW_ALT]),
+])
+_USS_METRIC_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_LULC_COMPONENTS),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 7),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _C_ROW_ALT]),
+])
+_SEISMIC_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _C_HEADER_SEISMIC),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('BACKGROUND', (0, -1), (-1, -1), _C_SEISMIC_TOTAL_BG),
+])
+
+# Table column widths, shared by every report built.
+_CW_INFO_WIDE = (5*cm, 12*cm)
+_CW_INFO = (4*cm, 9*cm)
+_CW_SCORE_DISPLAY = (4*cm, 10*cm)
+_CW_LULC_COMPONENTS = (4*cm, 5*cm, 2.5*cm, 2*cm)
+_CW_LULC_CLASSES = (6*cm, 3.5*cm, 3.5*cm)
+_CW_INDICES = (3*cm, 3*cm, 11*cm)
+_CW_CHANGE = (5*cm, 3*cm, 3*cm, 3*cm)
+_CW_AQI_SCORE = (2.5*cm, 3.5*cm, 3.5*cm, 6.5*cm)
+_CW_WHO = (1.8*cm, 4*cm, 3.2*cm, 2.8*cm, 1.8*cm, 2.5*cm)
+_CW_SATELLITE = (2.5*cm, 5*cm, 4*cm, 4*cm)
+_CW_AQI_STATS = (4*cm, 4*cm, 3*cm)
+_CW_HEAT_COMPONENTS = (3.5*cm, 5*cm, 2.5*cm, 2*cm)
+_CW_HEAT_STATS = (6*cm, 4*cm)
+_CW_UHI = (5*cm, 8*cm)
+_CW_TREND = (5*cm, 6*cm)
+_CW_FORECAST_METRICS = (4*cm, 3*cm, 3*cm, 3*cm, 3*cm)
+_CW_USS_MODULES = (4*cm, 2.5*cm, 2.5*cm, 3.5*cm, 3*cm)
+_CW_USS_METRICS = (6*cm, 3*cm, 3*cm, 3.5*cm)
+_CW_EQUITY = (8*cm, 3*cm, 3.5*cm, 3.5*cm)
+
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+_CSV_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+# Text separator above the sustainability report's closing notes.
+_SEP_50 = "—" * 50
+
+
+@lru_cache(maxsize=1)
+def _format_second(epoch_second):
+    return time.strftime(_TIMESTAMP_FORMAT, time.localtime(epoch_second))
+
+
+def _timestamp():
+    # Reports generated within the same wall-clock second share one strftime.
+    return _format_second(int(time.time()))
+
+
+@lru_cache(maxsize=256)
+def _pretty(key):
+    return key.replace('_', ' ').title()
+
+
+def _series_stats(values):
+    """
+    (mean, max, min) of the finite samples in a float64 array, or None when
+    there are none. NaN samples would otherwise turn every figure into nan.
+    """
+    values = values[np.isfinite(values)]
+    if not values.size:
+        return None
+    return values.mean(), values.max(), values.min()
+
+
+def _write_csv_header(csv_buffer, title, fields):
+    # One write for the whole comment block instead of one per line.
+    lines = [f"# {title}"]
+    lines.extend(f"# {label}: {value}" for label, value in fields)
+    lines.append(f"# Generated: {_timestamp()}")
+    lines.append("#\n")
+    csv_buffer.write("\n".join(lines))
+
+
+def _is_csv_number(value):
+    if isinstance(value, (bool, np.bool_)):
+        return False
+    return isinstance(value, (int, float, np.integer, np.floating))
+
+
+def _is_float_column(cells):
+    # pandas types a column float64 when every cell is a number or missing
+    # and at least one is a float or missing; an all-int column stays int64.
+    present = [cell for cell in cells if cell is not None]
+    if not present or not all(_is_csv_number(cell) for cell in present):
+        return False
+    if len(present) < len(cells):
+        return True
+    return not all(isinstance(cell, (int, np.integer)) for cell in present)
+
+
+def _csv_float(cell):
+    if cell is None or cell != cell:
+        return None
+    return float(cell)
+
+
+def _float_columns(rows):
+    """
+    Rows with every column pandas would have typed float64 converted to
+    float, so the CSV keeps the number format of DataFrame.to_csv: a column
+    mixing ints with floats or missing cells writes 10 as "10.0", while an
+    all-int column stays "10". Missing and NaN cells become None (empty).
+    """
+    rows = [tuple(row) for row in rows]
+    if not rows:
+        return rows
+
+    float_columns = [index for index, cells in enumerate(zip(*rows)) if _is_float_column(cells)]
+    if not float_columns:
+        return rows
+
+    converted = []
+    for row in rows:
+        row = list(row)
+        for index in float_columns:
+            row[index] = _csv_float(row[index])
+        converted.append(tuple(row))
+    return converted
+
 
 def generate_lulc_csv(stats, city_name="", year=""):
     if not stats or "classes" not in stats:
         return None
     
-    df_data = []
-    for name, data in sorted(stats["classes"].items(), key=lambda x: x[1]["percentage"], reverse=True):
-        df_data.append({
-            "Class": name,
-            "Area (km²)": data["area_sqkm"],
-            "Percentage (%)": data["percentage"],
-        })
+    csv_buffer = io.StringIO()
+    _write_csv_header(csv_buffer, "LULC Statistics Report", (
+        ("Location", city_name),
+        ("Year", year),
+        ("Total Area", f"{stats.get('total_area_sqkm', 'N/A')} km²"),
+    ))
     
-    df = pd.DataFrame(df_data)
+    rows = [(data["percentage"], name, data["area_sqkm"]) for name, data in stats["classes"].items()]
+    rows.sort(key=itemgetter(0), reverse=True)
+    rows = _float_columns(rows)
     
-    csv_buffer = io.StringIO()
-    csv_buffer.write(f"# LULC Statistics Report\n")
-    csv_buffer.write(f"# Location: {city_name}\n")
-    csv_buffer.write(f"# Year: {year}\n")
-    csv_buffer.write(f"# Total Area: {stats.get('total_area_sqkm', 'N/A')} km²\n")
-    csv_buffer.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    csv_buffer.write("#\n")
-    df.to_csv(csv_buffer, index=False)
+    # Class names never need quoting in practice, so rows are formatted
+    # directly; csv.writer is only used when a name would need escaping or
+    # a cell is empty.
+    if any(_CSV_NEEDS_QUOTING.search(name) or area is None or pct is None for pct, name, area in rows):
+        writer = csv.writer(csv_buffer, lineterminator="\n")
+        writer.writerow(("Class", "Area (km²)", "Percentage (%)"))
+        writer.writerows((name, area, pct) for pct, name, area in rows)
+    else:
+        csv_buffer.write("Class,Area (km²),Percentage (%)\n")
+        csv_buffer.write("".join([f"{name},{area},{pct}\n" for pct, name, area in rows]))
     
     return csv_buffer.getvalue()
 
@@ -37,33 +390,39 @@ def generate_change_analysis_csv(stats1, stats2, year1, year2, city_name=""):
     
     classes1 = stats1.get("classes", {})
     classes2 = stats2.get("classes", {})
-    all_classes = set(classes1.keys()) | set(classes2.keys())
-    
-    df_data = []
-    for class_name in all_classes:
-        data1 = classes1.get(class_name, {"percentage": 0, "area_sqkm": 0})
-        data2 = classes2.get(class_name, {"percentage": 0, "area_sqkm": 0})
-        
-        df_data.append({
-            "Class": class_name,
-            f"{year1} Area (km²)": data1.get("area_sqkm", 0),
-            f"{year2} Area (km²)": data2.get("area_sqkm", 0),
-            "Change (km²)": data2.get("area_sqkm", 0) - data1.get("area_sqkm", 0),
-            f"{year1} (%)": data1.get("percentage", 0),
-            f"{year2} (%)": data2.get("percentage", 0),
-            "Change (%)": data2.get("percentage", 0) - data1.get("percentage", 0),
-        })
-    
-    df = pd.DataFrame(df_data)
-    df = df.sort_values("Change (%)", key=abs, ascending=False)
+    names = sorted(set(classes1.keys()) | set(classes2.keys()))
+    
+    def column(classes, field):
+        # Keep pandas' dtype: a column of ints stays int64 (prints 5, not
+        # 5.0); any float makes it float64, missing classes included as 0.
+        values = [classes.get(name, {}).get(field, 0) for name in names]
+        if all(isinstance(value, (int, np.integer)) for value in values):
+            return np.array(values, dtype=np.int64)
+        return np.array(values, dtype=np.float64)
     
+    area1 = column(classes1, "area_sqkm")
+    area2 = column(classes2, "area_sqkm")
+    pct1 = column(classes1, "percentage")
+    pct2 = column(classes2, "percentage")
+    change_area = area2 - area1
+    change_pct = pct2 - pct1
+    order = np.argsort(-np.abs(change_pct), kind="stable")
+    
+    columns = (area1, area2, change_area, pct1, pct2, change_pct)
+    rows = ((names[i], *(col[i] for col in columns)) for i in order.tolist())
+    return _change_analysis_csv(rows, year1, year2, city_name)
+
+def _change_analysis_csv(rows, year1, year2, city_name):
     csv_buffer = io.StringIO()
-    csv_buffer.write(f"# LULC Change Analysis Report\n")
-    csv_buffer.write(f"# Location: {city_name}\n")
-    csv_buffer.write(f"# Period: {year1} to {year2}\n")
-    csv_buffer.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    csv_buffer.write("#\n")
-    df.to_csv(csv_buffer, index=False)
+    _write_csv_header(csv_buffer, "LULC Change Analysis Report", (
+        ("Location", city_name),
+        ("Period", f"{year1} to {year2}"),
+    ))
+    
+    writer = csv.writer(csv_buffer, lineterminator="\n")
+    writer.writerow(("Class", f"{year1} Area (km²)", f"{year2} Area (km²)", "Change (km²)",
+                     f"{year1} (%)", f"{year2} (%)", "Change (%)"))
+    writer.writerows(rows)
     
     return csv_buffer.getvalue()
 
@@ -71,21 +430,20 @@ def generate_aqi_csv(stats, pollutant, city_name="", date_range=""):
     if not stats:
         return None
     
-    df_data = [{
-        "Statistic": key.replace("_", " ").title(),
-        "Value": f"{value:.4f}" if isinstance(value, float) else value,
-        "Unit": stats.get("unit", "")
-    } for key, value in stats.items() if key != "unit"]
-    
-    df = pd.DataFrame(df_data)
+    unit = stats.get("unit", "")
     
     csv_buffer = io.StringIO()
-    csv_buffer.write(f"# AQI Statistics Report - {pollutant}\n")
-    csv_buffer.write(f"# Location: {city_name}\n")
-    csv_buffer.write(f"# Date Range: {date_range}\n")
-    csv_buffer.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    csv_buffer.write("#\n")
-    df.to_csv(csv_buffer, index=False)
+    _write_csv_header(csv_buffer, f"AQI Statistics Report - {pollutant}", (
+        ("Location", city_name),
+        ("Date Range", date_range),
+    ))
+    
+    writer = csv.writer(csv_buffer, lineterminator="\n")
+    writer.writerow(("Statistic", "Value", "Unit"))
+    writer.writerows(
+        (_pretty(key), f"{value:.4f}" if isinstance(value, float) else value, unit)
+        for key, value in stats.items() if key != "unit"
+    )
     
     return csv_buffer.getvalue()
 
@@ -93,14 +451,17 @@ def generate_time_series_csv(time_series, pollutant, city_name=""):
     if not time_series:
         return None
     
-    df = pd.DataFrame(time_series)
+    # Columns in first-seen order across all records; missing cells stay empty.
+    columns = list(dict.fromkeys(key for record in time_series for key in record))
     
     csv_buffer = io.StringIO()
-    csv_buffer.write(f"# Time Series Data - {pollutant}\n")
-    csv_buffer.write(f"# Location: {city_name}\n")
-    csv_buffer.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    csv_buffer.write("#\n")
-    df.to_csv(csv_buffer, index=False)
+    _write_csv_header(csv_buffer, f"Time Series Data - {pollutant}", (
+        ("Location", city_name),
+    ))
+    
+    writer = csv.writer(csv_buffer, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(_float_columns([record.get(column) for column in columns] for record in time_series))
     
     return csv_buffer.getvalue()
 
@@ -166,26 +527,79 @@ NAAQS_INDIA = {
     'O3': {'8hr': 100, 'daily': 180, 'unit': 'µg/m³'},
 }
 
+@lru_cache(maxsize=16)
+def _segment_upper_bounds(breakpoints):
+    return tuple(bp_hi for _, bp_hi, _, _ in breakpoints)
+
 def calculate_sub_aqi(concentration, breakpoints):
-    for bp_lo, bp_hi, aqi_lo, aqi_hi in breakpoints:
-        if bp_lo <= concentration <= bp_hi:
-            aqi = ((aqi_hi - aqi_lo) / (bp_hi - bp_lo)) * (concentration - bp_lo) + aqi_lo
-            return round(aqi)
-    return 500 if concentration > breakpoints[-1][1] else 0
+    # Segments are ascending and disjoint, so the first one whose upper bound
+    # reaches the concentration is the only one that can contain it.
+    upper_bounds = _segment_upper_bounds(tuple(breakpoints))
+    i = bisect.bisect_left(upper_bounds, concentration)
+    if i < len(upper_bounds) and breakpoints[i][0] <= concentration:
+        bp_lo, bp_hi, aqi_lo, aqi_hi = breakpoints[i]
+        aqi = ((aqi_hi - aqi_lo) / (bp_hi - bp_lo)) * (concentration - bp_lo) + aqi_lo
+        return round(aqi)
+    return 500 if concentration > upper_bounds[-1] else 0
+
+# Score ladders are stored as ascending threshold lists so each bucket test is a
+# single bisect instead of an if/elif chain. "<=" ladders use bisect_left,
+# ">=" ladders use bisect_right.
+def _ladder_index(thresholds, value):
+    # ">=" ladder. NaN fails every comparison, so like the original if/elif
+    # chain it falls through to the lowest bucket; bisect alone would put it
+    # past the top threshold.
+    if value != value:
+        return 0
+    return bisect.bisect_right(thresholds, value)
+
+def _ladder_index_le(thresholds, value):
+    # "<=" ladder, where the original chain's fall-through is the top bucket.
+    if value != value:
+        return len(thresholds)
+    return bisect.bisect_left(thresholds, value)
+
+_AQI_CATEGORY_THRESHOLDS = [50, 100, 150, 200, 300]
+_AQI_CATEGORIES = [
+    ("Good", "#00e400"),
+    ("Satisfactory", "#ffff00"),
+    ("Moderate", "#ff7e00"),
+    ("Poor", "#ff0000"),
+    ("Very Poor", "#8f3f97"),
+    ("Severe", "#7e0023"),
+]
 
 def get_aqi_category(aqi):
-    if aqi <= 50:
-        return "Good", "#00e400"
-    elif aqi <= 100:
-        return "Satisfactory", "#ffff00"
-    elif aqi <= 150:
-        return "Moderate", "#ff7e00"
-    elif aqi <= 200:
-        return "Poor", "#ff0000"
-    elif aqi <= 300:
-        return "Very Poor", "#8f3f97"
-    else:
-        return "Severe", "#7e0023"
+    return _AQI_CATEGORIES[_ladder_index_le(_AQI_CATEGORY_THRESHOLDS, aqi)]
+
+_RATIO_THRESHOLDS = [0.5, 1.0, 1.5, 2.0, 3.0]
+_RATIO_SCORES = [100, 80, 60, 40, 20, 0]
+_RATIO_STATUSES = ["Excellent", "Good", "Moderate", "Poor", "Very Poor", "Severe"]
+
+_RATING_THRESHOLDS = [20, 40, 60, 80]
+_COMPLIANCE_RATINGS = [
+    "Severe - Critical Pollution Levels",
+    "Very Poor - Major Exceedances",
+    "Poor - Significant Exceedances",
+    "Moderate - Minor Exceedances",
+    "Good - Meets WHO Guidelines",
+]
+_SCORE_COLOR_THRESHOLDS = [40, 60, 80]
+_SCORE_COLORS = ['#d32f2f', '#f57c00', '#fbc02d', '#388e3c']
+
+# WHO_STANDARDS_2021 flattened per pollutant to
+# (name, comparable, limit, unit, breakpoints, note) for the scoring loop.
+_WHO_PROFILES = {
+    pollutant: (
+        std.get('name', pollutant),
+        std.get('comparable', False),
+        std.get('daily', std.get('annual', 0)),
+        std.get('unit', ''),
+        tuple(std['aqi_breakpoints']) if 'aqi_breakpoints' in std else None,
+        std.get('note', 'Column density measurement'),
+    )
+    for pollutant, std in WHO_STANDARDS_2021.items()
+}
 
 def calculate_aqi_compliance_score(pollutant_stats):
     if not pollutant_stats:
@@ -202,62 +616,45 @@ def calculate_aqi_compliance_score(pollutant_stats):
         if mean_val is None or mean_val == 0:
             continue
         
-        if pollutant in WHO_STANDARDS_2021:
-            std = WHO_STANDARDS_2021[pollutant]
-            is_comparable = std.get('comparable', False)
+        profile = _WHO_PROFILES.get(pollutant)
+        if profile is not None:
+            name, is_comparable, who_limit, unit, breakpoints, note = profile
             
             if is_comparable:
-                who_limit = std.get('daily', std.get('annual', 0))
-                
                 if who_limit == 0:
                     continue
                 
                 ratio = mean_val / who_limit if who_limit else 1
                 
-                if ratio <= 0.5:
-                    score = 100
-                    status = "Excellent"
-                elif ratio <= 1.0:
-                    score = 80
-                    status = "Good"
-                elif ratio <= 1.5:
-                    score = 60
-                    status = "Moderate"
-                elif ratio <= 2.0:
-                    score = 40
-                    status = "Poor"
-                elif ratio <= 3.0:
-                    score = 20
-                    status = "Very Poor"
-                else:
-                    score = 0
-                    status = "Severe"
+                band = _ladder_index_le(_RATIO_THRESHOLDS, ratio)
+                score = _RATIO_SCORES[band]
+                status = _RATIO_STATUSES[band]
                 
                 sub_aqi = 0
-                if 'aqi_breakpoints' in std:
-                    sub_aqi = calculate_sub_aqi(mean_val, std['aqi_breakpoints'])
+                if breakpoints is not None:
+                    sub_aqi = calculate_sub_aqi(mean_val, breakpoints)
                     sub_aqis.append(sub_aqi)
                 
                 total_score += score
                 max_score += 100
                 details.append({
                     'pollutant': pollutant,
-                    'name': std['name'],
+                    'name': name,
                     'measured': mean_val,
                     'who_limit': who_limit,
                     'ratio': ratio,
                     'score': score,
                     'sub_aqi': sub_aqi,
                     'status': status,
-                    'unit': std.get('unit', '')
+                    'unit': unit
                 })
             else:
                 satellite_details.append({
                     'pollutant': pollutant,
-                    'name': std.get('name', pollutant),
+                    'name': name,
                     'measured': mean_val,
                     'unit': stats.get('unit', ''),
-                    'note': std.get('note', 'Column density measurement')
+                    'note': note
                 })
         else:
             satellite_details.append({
@@ -274,16 +671,8 @@ def calculate_aqi_compliance_score(pollutant_stats):
     
     if max_score == 0:
         rating = "N/A - No comparable pollutants"
-    elif overall_score >= 80:
-        rating = "Good - Meets WHO Guidelines"
-    elif overall_score >= 60:
-        rating = "Moderate - Minor Exceedances"
-    elif overall_score >= 40:
-        rating = "Poor - Significant Exceedances"
-    elif overall_score >= 20:
-        rating = "Very Poor - Major Exceedances"
     else:
-        rating = "Severe - Critical Pollution Levels"
+        rating = _COMPLIANCE_RATINGS[bisect.bisect_right(_RATING_THRESHOLDS, overall_score)]
     
     return {
         'score': round(overall_score, 1),
@@ -296,6 +685,31 @@ def calculate_aqi_compliance_score(pollutant_stats):
     }
 
 
+_TEMP_THRESHOLDS = [25, 30, 35, 40, 45]
+_TEMP_SCORES = [0, 20, 40, 60, 80, 100]
+_UHI_THRESHOLDS = [1, 2, 4, 6, 8]
+_UHI_SCORES = [0, 20, 40, 60, 80, 100]
+_UHI_SEVERITY_THRESHOLDS = [1, 3, 5]
+_UHI_SEVERITIES = [
+    "Minimal UHI effect",
+    "Mild UHI effect - Slight urban warming",
+    "Moderate UHI effect - Noticeable urban warming",
+    "Severe UHI effect - Significant urban warming",
+]
+_RANGE_THRESHOLDS = [5, 10, 15]
+_RANGE_SCORES = [20, 40, 60, 80]
+_TREND_THRESHOLDS = [0, 0.1, 0.3, 0.5]
+_TREND_SCORES = [20, 40, 60, 80, 100]
+_EXTREME_THRESHOLDS = [5, 10, 20, 30]
+_EXTREME_SCORES = [20, 40, 60, 80, 100]
+_VULNERABILITY_RATINGS = [
+    ("Very Low Vulnerability", "#1976d2"),
+    ("Low Vulnerability", "#388e3c"),
+    ("Moderate Vulnerability", "#fbc02d"),
+    ("High Vulnerability", "#f57c00"),
+    ("Very High Vulnerability", "#d32f2f"),
+]
+
 def calculate_heat_vulnerability_score(lst_stats, uhi_stats=None, time_series=None, warming_trend=None):
     if not lst_stats:
         return {'score': 0, 'rating': 'Unknown', 'components': {}}
@@ -306,18 +720,7 @@ def calculate_heat_vulnerability_score(lst_stats, uhi_stats=None, time_series=No
     
     mean_temp = lst_stats.get('mean_celsius') or lst_stats.get('mean', 0)
     if mean_temp:
-        if mean_temp >= 45:
-            temp_score = 100
-        elif mean_temp >= 40:
-            temp_score = 80
-        elif mean_temp >= 35:
-            temp_score = 60
-        elif mean_temp >= 30:
-            temp_score = 40
-        elif mean_temp >= 25:
-            temp_score = 20
-        else:
-            temp_score = 0
+        temp_score = _TEMP_SCORES[_ladder_index(_TEMP_THRESHOLDS, mean_temp)]
         
         components['temperature'] = {
             'value': mean_temp,
@@ -330,18 +733,7 @@ def calculate_heat_vulnerability_score(lst_stats, uhi_stats=None, time_series=No
     
     if uhi_stats:
         uhi_intensity = uhi_stats.get('mean', 0) or 0
-        if uhi_intensity >= 8:
-            uhi_score = 100
-        elif uhi_intensity >= 6:
-            uhi_score = 80
-        elif uhi_intensity >= 4:
-            uhi_score = 60
-        elif uhi_intensity >= 2:
-            uhi_score = 40
-        elif uhi_intensity >= 1:
-            uhi_score = 20
-        else:
-            uhi_score = 0
+        uhi_score = _UHI_SCORES[_ladder_index(_UHI_THRESHOLDS, uhi_intensity)]
         
         components['uhi'] = {
             'value': uhi_intensity,
@@ -355,14 +747,7 @@ def calculate_heat_vulnerability_score(lst_stats, uhi_stats=None, time_series=No
     max_temp = lst_stats.get('max_celsius') or lst_stats.get('max', 0)
     if max_temp and mean_temp:
         temp_range = max_temp - mean_temp
-        if temp_range >= 15:
-            range_score = 80
-        elif temp_range >= 10:
-            range_score = 60
-        elif temp_range >= 5:
-            range_score = 40
-        else:
-            range_score = 20
+        range_score = _RANGE_SCORES[_ladder_index(_RANGE_THRESHOLDS, temp_range)]
         
         components['variability'] = {
             'value': temp_range,
@@ -375,16 +760,7 @@ def calculate_heat_vulnerability_score(lst_stats, uhi_stats=None, time_series=No
     
     if warming_trend:
         slope = warming_trend.get('slope_per_year', 0) or warming_trend.get('slope', 0)
-        if slope >= 0.5:
-            trend_score = 100
-        elif slope >= 0.3:
-            trend_score = 80
-        elif slope >= 0.1:
-            trend_score = 60
-        elif slope >= 0:
-            trend_score = 40
-        else:
-            trend_score = 20
+        trend_score = _TREND_SCORES[_ladder_index(_TREND_THRESHOLDS, slope)]
         
         components['warming_trend'] = {
             'value': slope,
@@ -396,20 +772,11 @@ def calculate_heat_vulnerability_score(lst_stats, uhi_stats=None, time_series=No
         total_weight += 20
     
     if time_series and len(time_series) > 5:
-        temps = [d.get('mean_lst', 0) for d in time_series if d.get('mean_lst')]
-        if temps:
-            extreme_days = sum(1 for t in temps if t and t >= 40)
-            extreme_pct = (extreme_days / len(temps)) * 100
-            if extreme_pct >= 30:
-                extreme_score = 100
-            elif extreme_pct >= 20:
-                extreme_score = 80
-            elif extreme_pct >= 10:
-                extreme_score = 60
-            elif extreme_pct >= 5:
-                extreme_score = 40
-            else:
-                extreme_score = 20
+        temps = np.fromiter((d['mean_lst'] for d in time_series if d.get('mean_lst')), dtype=np.float64)
+        if temps.size:
+            extreme_days = int(np.count_nonzero(temps >= 40))
+            extreme_pct = (extreme_days / temps.size) * 100
+            extreme_score = _EXTREME_SCORES[bisect.bisect_right(_EXTREME_THRESHOLDS, extreme_pct)]
             
             components['extreme_heat'] = {
                 'value': extreme_pct,
@@ -422,21 +789,7 @@ def calculate_heat_vulnerability_score(lst_stats, uhi_stats=None, time_series=No
     
     final_score = (weighted_score / total_weight) if total_weight > 0 else 0
     
-    if final_score >= 80:
-        rating = "Very High Vulnerability"
-        color = "#d32f2f"
-    elif final_score >= 60:
-        rating = "High Vulnerability"
-        color = "#f57c00"
-    elif final_score >= 40:
-        rating = "Moderate Vulnerability"
-        color = "#fbc02d"
-    elif final_score >= 20:
-        rating = "Low Vulnerability"
-        color = "#388e3c"
-    else:
-        rating = "Very Low Vulnerability"
-        color = "#1976d2"
+    rating, color = _VULNERABILITY_RATINGS[bisect.bisect_right(_RATING_THRESHOLDS, final_score)]
     
     return {
         'score': round(final_score, 1),
@@ -446,6 +799,27 @@ def calculate_heat_vulnerability_score(lst_stats, uhi_stats=None, time_series=No
     }
 
 
+_GREEN_THRESHOLDS = [10, 20, 30, 40, 50]
+_GREEN_SCORES = [0, 20, 40, 60, 80, 100]
+_IMPERVIOUS_THRESHOLDS = [20, 30, 40, 50, 60]
+_IMPERVIOUS_SCORES = [100, 80, 60, 40, 20, 0]
+_WATER_THRESHOLDS = [1, 2, 5, 10]
+_WATER_SCORES = [20, 40, 60, 80, 100]
+_DIVERSITY_THRESHOLDS = [3, 4, 5, 7]
+_DIVERSITY_SCORES = [20, 40, 60, 80, 100]
+_TREE_CHANGE_THRESHOLDS = [-5, 0, 5]
+_TREE_CHANGE_SCORES = [10, 40, 70, 100]
+_SUSTAINABILITY_RATINGS = [
+    ("Critical - Needs Intervention", "#d32f2f"),
+    ("Poor Sustainability", "#f57c00"),
+    ("Moderate Sustainability", "#fbc02d"),
+    ("Good Sustainability", "#388e3c"),
+    ("Excellent Sustainability", "#1976d2"),
+]
+
+_GREEN_CLASSES = frozenset(('Trees', 'Grass', 'Crops', 'Flooded Vegetation', 'Shrub & Scrub'))
+_IMPERVIOUS_CLASSES = frozenset(('Built Area', 'Bare Ground'))
+
 def calculate_land_sustainability_score(lulc_stats, change_stats=None):
     if not lulc_stats or 'classes' not in lulc_stats:
         return {'score': 0, 'rating': 'Unknown', 'components': {}}
@@ -455,21 +829,22 @@ def calculate_land_sustainability_score(lulc_stats, change_stats=None):
     total_weight = 0
     weighted_score = 0
     
-    green_classes = ['Trees', 'Grass', 'Crops', 'Flooded Vegetation', 'Shrub & Scrub']
-    green_pct = sum(classes.get(c, {}).get('percentage', 0) for c in green_classes)
-    
-    if green_pct >= 50:
-        green_score = 100
-    elif green_pct >= 40:
-        green_score = 80
-    elif green_pct >= 30:
-        green_score = 60
-    elif green_pct >= 20:
-        green_score = 40
-    elif green_pct >= 10:
-        green_score = 20
-    else:
-        green_score = 0
+    green_pct = 0
+    impervious_pct = 0
+    water_pct = 0
+    num_classes = 0
+    for name, data in classes.items():
+        pct = data.get('percentage', 0)
+        if pct > 1:
+            num_classes += 1
+        if name in _GREEN_CLASSES:
+            green_pct += pct
+        elif name in _IMPERVIOUS_CLASSES:
+            impervious_pct += pct
+        elif name == 'Water':
+            water_pct += pct
+    
+    green_score = _GREEN_SCORES[_ladder_index(_GREEN_THRESHOLDS, green_pct)]
     
     components['green_cover'] = {
         'value': green_pct,
@@ -480,22 +855,7 @@ def calculate_land_sustainability_score(lulc_stats, change_stats=None):
     weighted_score += green_score * 35
     total_weight += 35
     
-    built_pct = classes.get('Built Area', {}).get('percentage', 0)
-    bare_pct = classes.get('Bare Ground', {}).get('percentage', 0)
-    impervious_pct = built_pct + bare_pct
-    
-    if impervious_pct <= 20:
-        impervious_score = 100
-    elif impervious_pct <= 30:
-        impervious_score = 80
-    elif impervious_pct <= 40:
-        impervious_score = 60
-    elif impervious_pct <= 50:
-        impervious_score = 40
-    elif impervious_pct <= 60:
-        impervious_score = 20
-    else:
-        impervious_score = 0
+    impervious_score = _IMPERVIOUS_SCORES[_ladder_index_le(_IMPERVIOUS_THRESHOLDS, impervious_pct)]
     
     components['impervious'] = {
         'value': impervious_pct,
@@ -506,17 +866,7 @@ def calculate_land_sustainability_score(lulc_stats, change_stats=None):
     weighted_score += impervious_score * 25
     total_weight += 25
     
-    water_pct = classes.get('Water', {}).get('percentage', 0)
-    if water_pct >= 10:
-        water_score = 100
-    elif water_pct >= 5:
-        water_score = 80
-    elif water_pct >= 2:
-        water_score = 60
-    elif water_pct >= 1:
-        water_score = 40
-    else:
-        water_score = 20
+    water_score = _WATER_SCORES[_ladder_index(_WATER_THRESHOLDS, water_pct)]
     
     components['water'] = {
         'value': water_pct,
@@ -527,17 +877,7 @@ def calculate_land_sustainability_score(lulc_stats, change_stats=None):
     weighted_score += water_score * 15
     total_weight += 15
     
-    num_classes = sum(1 for c, d in classes.items() if d.get('percentage', 0) > 1)
-    if num_classes >= 7:
-        diversity_score = 100
-    elif num_classes >= 5:
-        diversity_score = 80
-    elif num_classes >= 4:
-        diversity_score = 60
-    elif num_classes >= 3:
-        diversity_score = 40
-    else:
-        diversity_score = 20
+    diversity_score = _DIVERSITY_SCORES[bisect.bisect_right(_DIVERSITY_THRESHOLDS, num_classes)]
     
     components['diversity'] = {
         'value': num_classes,
@@ -550,14 +890,7 @@ def calculate_land_sustainability_score(lulc_stats, change_stats=None):
     
     if change_stats:
         tree_change = change_stats.get('Trees', {}).get('change', 0)
-        if tree_change >= 5:
-            change_score = 100
-        elif tree_change >= 0:
-            change_score = 70
-        elif tree_change >= -5:
-            change_score = 40
-        else:
-            change_score = 10
+        change_score = _TREE_CHANGE_SCORES[_ladder_index(_TREE_CHANGE_THRESHOLDS, tree_change)]
         
         components['vegetation_trend'] = {
             'value': tree_change,
@@ -570,21 +903,7 @@ def calculate_land_sustainability_score(lulc_stats, change_stats=None):
     
     final_score = (weighted_score / total_weight) if total_weight > 0 else 0
     
-    if final_score >= 80:
-        rating = "Excellent Sustainability"
-        color = "#1976d2"
-    elif final_score >= 60:
-        rating = "Good Sustainability"
-        color = "#388e3c"
-    elif final_score >= 40:
-        rating = "Moderate Sustainability"
-        color = "#fbc02d"
-    elif final_score >= 20:
-        rating = "Poor Sustainability"
-        color = "#f57c00"
-    else:
-        rating = "Critical - Needs Intervention"
-        color = "#d32f2f"
+    rating, color = _SUSTAINABILITY_RATINGS[bisect.bisect_right(_RATING_THRESHOLDS, final_score)]
     
     return {
         'score': round(final_score, 1),
@@ -594,16 +913,62 @@ def calculate_land_sustainability_score(lulc_stats, change_stats=None):
     }
 
 
+_chart_state = threading.local()
+
+
+def _gauge_bands():
+    colors_gauge = ['#d32f2f', '#f57c00', '#fbc02d', '#388e3c', '#1976d2']
+    sections = [20, 40, 60, 80, 100]
+    
+    theta = np.linspace(np.pi, 0, 100)
+    position = np.linspace(0, 100, 100)
+    bands = []
+    for i, (end, color) in enumerate(zip(sections, colors_gauge)):
+        start = sections[i-1] if i > 0 else 0
+        mask = (position >= start) & (position < end)
+        bands.append((theta[mask], color))
+    return tuple(bands)
+
+
+# The gauge arc never changes; only the needle and score text do.
+_GAUGE_BANDS = _gauge_bands()
+
+
+def _chart_figure(width, height):
+    """
+    Figure and fresh Axes for one chart. Each thread keeps a single Figure
+    outside pyplot's registry and clears it between charts, rather than
+    building and closing a new figure every time.
+    """
+    fig = getattr(_chart_state, 'fig', None)
+    if fig is None:
+        # matplotlib is only imported once a chart is drawn, so CSV-only
+        # callers never pay for it.
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(dpi=100)
+        FigureCanvasAgg(fig)
+        _chart_state.fig = fig
+    else:
+        fig.clear()
+    fig.set_size_inches(width/100, height/100)
+    return fig, fig.add_subplot()
+
+
 def _create_chart_image(chart_type, data, title, width=400, height=250):
     if chart_type == 'bar' and isinstance(data, dict) and len(data) > 5:
         height = max(250, len(data) * 30)
     
-    fig, ax = plt.subplots(figsize=(width/100, height/100), dpi=100)
+    from matplotlib import colormaps
+    from matplotlib.patches import Circle
+    
+    fig, ax = _chart_figure(width, height)
     
     if chart_type == 'pie':
         labels = list(data.keys())
-        values = [d.get('percentage', 0) for d in data.values()]
-        pie_colors = plt.cm.Set3(np.linspace(0, 1, len(labels)))
+        values = np.fromiter((d.get('percentage', 0) for d in data.values()), dtype=np.float64, count=len(data))
+        pie_colors = colormaps['Set3'](np.linspace(0, 1, len(labels)))
         
         wedges, texts, autotexts = ax.pie(values, autopct='%1.1f%%', colors=pie_colors, startangle=90, pctdistance=0.75)
         
@@ -615,8 +980,8 @@ def _create_chart_image(chart_type, data, title, width=400, height=250):
     
     elif chart_type == 'bar':
         labels = list(data.keys())
-        values = [d.get('percentage', 0) if isinstance(d, dict) else d for d in data.values()]
-        bar_colors = plt.cm.viridis(np.linspace(0.2, 0.8, len(labels)))
+        values = np.array([d.get('percentage', 0) if isinstance(d, dict) else d for d in data.values()], dtype=np.float64)
+        bar_colors = colormaps['viridis'](np.linspace(0.2, 0.8, len(labels)))
         
         if len(labels) > 5:
             ax.barh(range(len(labels)), values, color=bar_colors)
@@ -634,30 +999,26 @@ def _create_chart_image(chart_type, data, title, width=400, height=250):
     elif chart_type == 'line':
         if isinstance(data, list):
             dates = [d.get('date', d.get('year', '')) for d in data]
-            values = [d.get('value', d.get('mean_lst', d.get('mean', 0))) for d in data]
-            ax.plot(range(len(dates)), values, marker='o', linewidth=2, markersize=4)
-            ax.set_xticks(range(0, len(dates), max(1, len(dates)//6)))
-            ax.set_xticklabels([dates[i] for i in range(0, len(dates), max(1, len(dates)//6))], 
-                              rotation=45, ha='right', fontsize=8)
+            # dtype=float64 turns missing (None) samples into NaN gaps
+            values = np.array([d.get('value', d.get('mean_lst', d.get('mean', 0))) for d in data], dtype=np.float64)
+            n = len(dates)
+            stride = max(1, n // 6)
+            ax.plot(np.arange(n), values, marker='o', linewidth=2, markersize=4)
+            ax.set_xticks(np.arange(0, n, stride))
+            ax.set_xticklabels(dates[::stride], rotation=45, ha='right', fontsize=8)
             ax.set_ylabel('Value')
             ax.set_title(title, fontsize=10, fontweight='bold')
             ax.grid(True, alpha=0.3)
     
     elif chart_type == 'gauge':
         score = data.get('score', 0)
-        colors_gauge = ['#d32f2f', '#f57c00', '#fbc02d', '#388e3c', '#1976d2']
-        sections = [20, 40, 60, 80, 100]
-        
-        theta = np.linspace(np.pi, 0, 100)
-        for i, (end, color) in enumerate(zip(sections, colors_gauge)):
-            start = sections[i-1] if i > 0 else 0
-            mask = (np.linspace(0, 100, 100) >= start) & (np.linspace(0, 100, 100) < end)
-            ax.fill_between(theta[mask], 0.6, 1, color=color, alpha=0.7)
+        for band_theta, color in _GAUGE_BANDS:
+            ax.fill_between(band_theta, 0.6, 1, color=color, alpha=0.7)
         
         needle_angle = np.pi - (score / 100) * np.pi
         ax.arrow(0, 0, 0.5 * np.cos(needle_angle), 0.5 * np.sin(needle_angle),
                 head_width=0.05, head_length=0.05, fc='black', ec='black')
-        ax.add_patch(plt.Circle((0, 0), 0.08, color='black'))
+        ax.add_patch(Circle((0, 0), 0.08, color='black'))
         ax.set_xlim(-1.2, 1.2)
         ax.set_ylim(-0.2, 1.2)
         ax.set_aspect('equal')
@@ -665,39 +1026,180 @@ def _create_chart_image(chart_type, data, title, width=400, height=250):
         ax.text(0, -0.1, f"{score:.0f}", fontsize=20, ha='center', fontweight='bold')
         ax.set_title(title, fontsize=10, fontweight='bold', y=0.95)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
+    # ReportLab decodes the PNG and re-compresses the pixels into the PDF, so
+    # spend as little as possible on PNG compression here. Line charts are
+    # requested at their printed size (100 px per inch) and tight_layout
+    # already fits them, so they skip the extra draw pass of a tight crop and
+    # come out exactly the size of their frame. Pie legends sit outside the
+    # axes and still need the crop.
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight', dpi=100)
-    plt.close(fig)
+    bbox = None if chart_type == 'line' else 'tight'
+    fig.savefig(buf, format='png', bbox_inches=bbox, dpi=100, pil_kwargs={'compress_level': 1})
     buf.seek(0)
     
     return buf
 
 
 
-def _add_insights_section(elements, styles_dict, insights):
+# Rendered chart PNGs keyed on the plotted values plus title and size, so
+# the same chart rendered again (report retries, repeated city/date exports)
+# reuses the PNG instead of redrawing it. Oldest entries are evicted first.
+_CHART_CACHE = {}
+_CHART_CACHE_SIZE = 128
+_chart_cache_lock = threading.Lock()
+
+# What bad chart data (missing/None values, empty or malformed series) can
+# raise out of matplotlib and PIL. A failed chart is left out of the report;
+# anything else, e.g. MemoryError or a broken install, is not swallowed.
+_CHART_ERRORS = (ValueError, TypeError, KeyError, AttributeError, RuntimeError, OSError)
+
+
+def _cache_chart_png(key, png):
+    # Callers hold _chart_cache_lock.
+    if len(_CHART_CACHE) >= _CHART_CACHE_SIZE:
+        del _CHART_CACHE[next(iter(_CHART_CACHE))]
+    _CHART_CACHE[key] = png
+
+
+def _render_line_chart(points, title, width, height):
+    series = [{'date': date, 'value': value} for date, value in points]
+    try:
+        return _create_chart_image('line', series, title, width, height).getvalue()
+    except _CHART_ERRORS as e:
+        logger.warning("Line chart %r failed to render: %s", title, e)
+        return None
+
+
+def _line_chart_key(data, title, width, height):
+    # None when the series is malformed (a non-dict point, an unhashable
+    # value), so only that chart is left out of the report.
+    try:
+        points = tuple((d.get('date', d.get('year', '')), d.get('value', d.get('mean_lst', d.get('mean', 0))))
+                       for d in data)
+        hash(points)
+    except _CHART_ERRORS as e:
+        logger.warning("Line chart %r has malformed data: %s", title, e)
+        return None
+    return points, title, width, height
+
+
+def _line_chart_images(specs):
     """
-    Helper function to add the insights section to the PDF report.
+    Line charts for a list of (data, title, width, height) specs, returned in
+    order as fresh BytesIO objects (None where a chart's data is malformed,
+    it failed to render or the series has fewer than two points).
     """
-    if not insights:
-        return
+    keys = [_line_chart_key(*spec) for spec in specs]
+    pngs = {None: None}
+    with _chart_cache_lock:
+        pngs.update((key, _CHART_CACHE[key]) for key in keys if key is not None and key in _CHART_CACHE)
+    # A trend needs at least two points; don't spin up matplotlib for less.
+    pngs.update((key, None) for key in keys if key is not None and len(key[0]) < 2)
+    missing = [key for key in dict.fromkeys(keys) if key not in pngs]
+    pngs.update((key, _render_line_chart(*key)) for key in missing)
+    
+    with _chart_cache_lock:
+        for key in missing:
+            if pngs[key] is not None:
+                _cache_chart_png(key, pngs[key])
+    
+    return [io.BytesIO(pngs[key]) if pngs[key] is not None else None for key in keys]
+
+
+def _line_chart_image(data, title, width=400, height=250):
+    return _line_chart_images([(data, title, width, height)])[0]
+
+
+def _pie_chart_image(stats, title, width=400, height=250):
+    """
+    Pie chart of the class percentages in stats as a fresh BytesIO, served
+    from the chart cache when the same distribution was drawn before.
+    Rendering errors propagate to the caller.
+    """
+    slices = tuple((name, d.get('percentage', 0)) for name, d in stats.items())
+    key = ('pie', slices, title, width, height)
+    with _chart_cache_lock:
+        png = _CHART_CACHE.get(key)
+    if png is None:
+        png = _create_chart_image('pie', stats, title, width, height).getvalue()
+        with _chart_cache_lock:
+            _cache_chart_png(key, png)
+    return io.BytesIO(png)
+
+
+class _ChartImage(Image):
+    """
+    Image flowable for a rendered chart PNG. ReportLab keeps the decoded
+    pixels of an in-memory image on the flowable until the whole document
+    is built; this drops them once the chart is drawn, so a report with
+    many charts holds one decoded chart at a time rather than all of them.
+    """
+    def draw(self):
+        super().draw()
+        self._img = self._file = None
 
-    from reportlab.lib import colors
-    from reportlab.platypus import Paragraph, Spacer
-    from reportlab.lib.styles import ParagraphStyle
+
+class _PDFSink:
+    """
+    Minimal write target for SimpleDocTemplate. ReportLab renders the whole
+    PDF to one bytes object and hands it to a single write(), so keeping a
+    reference avoids copying it into a BytesIO and back out via getvalue().
+    """
+    def __init__(self):
+        self._chunks = []
     
-    heading_style = styles_dict.get('Heading')
-    body_style = styles_dict.get('Body')
+    def write(self, data):
+        self._chunks.append(data)
+        return len(data)
+    
+    def flush(self):
+        pass
     
-    # Create specific styles for insights
+    def getvalue(self):
+        # join() returns a lone bytes chunk as-is, without copying it
+        return b"".join(self._chunks)
+    
+    def close(self):
+        self._chunks = []
+
+
+def _build_pdf(doc, elements, buffer, out_stream=None):
+    """
+    Build the document and return the PDF bytes. When the caller supplied
+    an out_stream the PDF is written straight into it and True is returned,
+    skipping the extra getvalue() copy of the whole document.
+    """
+    doc.build(elements)
+    if out_stream is not None:
+        return True
+    pdf_data = buffer.getvalue()
+    buffer.close()
+    return pdf_data
+
+
+def _footer(note_style, *notes):
+    """Closing rule, portal credit and report-specific notes."""
+    return (
+        Spacer(1, 30),
+        HRFlowable(width="100%", thickness=0.5, color=colors.grey, spaceBefore=6, spaceAfter=6),
+        Paragraph("Generated by India GIS & Remote Sensing Portal", note_style),
+        *(Paragraph(note, note_style) for note in notes),
+    )
+
+
+@lru_cache(maxsize=16)
+def _insight_styles(heading_style, body_style):
+    # Keyed on the parent style objects, which are module-level for most
+    # reports, so the derived styles are built once rather than per report.
     subheading_style = ParagraphStyle(
         'SubHeading', 
         parent=heading_style, 
         fontSize=12, 
         spaceBefore=10, 
         spaceAfter=5,
-        textColor=colors.HexColor('#455a64')
+        textColor=_C_INSIGHT_SUBHEADING
     )
     
     bullet_style = ParagraphStyle(
@@ -707,72 +1209,275 @@ def _add_insights_section(elements, styles_dict, insights):
         spaceAfter=3,
         bulletIndent=5
     )
+    return subheading_style, bullet_style
+
+
+def _add_insights_section(elements, styles_dict, insights):
+    """
+    Helper function to add the insights section to the PDF report.
+    """
+    if not insights:
+        return
+
+    heading_style = styles_dict.get('Heading')
+    body_style = styles_dict.get('Body')
+    subheading_style, bullet_style = _insight_styles(heading_style, body_style)
     
-    elements.append(Spacer(1, 20))
-    elements.append(Paragraph("Actionable Insights & Recommendations", heading_style))
-    elements.append(Spacer(1, 10))
+    elements.extend((
+        Spacer(1, 20),
+        Paragraph("Actionable Insights & Recommendations", heading_style),
+        Spacer(1, 10),
+    ))
     
     # (a) Key Findings
     if insights.get("key_findings"):
         elements.append(Paragraph("Key Environmental Findings", subheading_style))
-        for item in insights["key_findings"]:
-             elements.append(Paragraph(f"• {item}", bullet_style))
+        elements.extend(Paragraph(f"• {item}", bullet_style) for item in insights["key_findings"])
     
     # (b) Root Causes
     if insights.get("root_causes"):
         elements.append(Paragraph("Root Cause Analysis", subheading_style))
-        for item in insights["root_causes"]:
-             elements.append(Paragraph(f"• {item}", bullet_style))
+        elements.extend(Paragraph(f"• {item}", bullet_style) for item in insights["root_causes"])
     
     # (c) Mitigation Actions
     if insights.get("mitigation_actions"):
         elements.append(Paragraph("Recommended Mitigation Actions", subheading_style))
-        for item in insights["mitigation_actions"]:
-             elements.append(Paragraph(f"• {item}", bullet_style))
+        elements.extend(Paragraph(f"• {item}", bullet_style) for item in insights["mitigation_actions"])
     
     # (d) Future Risks
     if insights.get("future_risks"):
-        elements.append(Paragraph("Future Risk Assessment", subheading_style))
-        elements.append(Paragraph(insights["future_risks"], body_style))
+        elements.extend((
+            Paragraph("Future Risk Assessment", subheading_style),
+            Paragraph(insights["future_risks"], body_style),
+        ))
     
     # (e) Rules Used
     if insights.get("rules_used"):
-        elements.append(Spacer(1, 10))
-        elements.append(Paragraph("Analysis Basis (Rules & Thresholds)", subheading_style))
-        for item in insights["rules_used"]:
-             elements.append(Paragraph(f"• {item}", bullet_style))
+        elements.extend((Spacer(1, 10), Paragraph("Analysis Basis (Rules & Thresholds)", subheading_style)))
+        elements.extend(Paragraph(f"• {item}", bullet_style) for item in insights["rules_used"])
     
     elements.append(Spacer(1, 20))
 
 
-def generate_lulc_pdf_report(report_data):
+_STYLES = getSampleStyleSheet()
+
+
+def _report_styles(title_color, heading_color):
+    return {
+        'title': ParagraphStyle('Title', parent=_STYLES['Heading1'], fontSize=22,
+                                spaceAfter=20, alignment=TA_CENTER, textColor=_hex(title_color)),
+        'subtitle': ParagraphStyle('Subtitle', parent=_STYLES['Heading2'], fontSize=14,
+                                   spaceAfter=10, alignment=TA_CENTER, textColor=colors.grey),
+        'heading': ParagraphStyle('Heading', parent=_STYLES['Heading2'], fontSize=14,
+                                  spaceBefore=15, spaceAfter=10, textColor=_hex(heading_color)),
+        'body': ParagraphStyle('Body', parent=_STYLES['Normal'], fontSize=10,
+                               spaceAfter=8, alignment=TA_JUSTIFY),
+        'note': ParagraphStyle('Note', parent=_STYLES['Normal'], fontSize=8,
+                               textColor=colors.grey, alignment=TA_LEFT, leftIndent=20),
+    }
+
+
+# Built once at import; ParagraphStyle objects are read-only during a build.
+_LULC_STYLES = _report_styles('#1565c0', '#2e7d32')
+_AQI_STYLES = _report_styles('#1565c0', '#0277bd')
+_HEAT_STYLES = _report_styles('#d32f2f', '#e65100')
+_PREDICTIVE_STYLES = _report_styles('#5e35b1', '#673ab7')
+
+# The sustainability report has its own layout: larger title, a subheading
+# level for roadmap phases and unindented notes.
+_SUSTAINABILITY_STYLES = {
+    'title': ParagraphStyle('Title', parent=_STYLES['Heading1'], fontSize=24,
+                            spaceAfter=10, alignment=TA_CENTER, textColor=_C_USS_TITLE),
+    'subtitle': ParagraphStyle('Subtitle', parent=_STYLES['Heading2'], fontSize=12,
+                               spaceAfter=20, alignment=TA_CENTER, textColor=colors.grey),
+    'heading': ParagraphStyle('Heading', parent=_STYLES['Heading2'], fontSize=14,
+                              spaceBefore=20, spaceAfter=10, textColor=_C_HEADER_BLUE),
+    'subheading': ParagraphStyle('SubHeading', parent=_STYLES['Heading3'], fontSize=12,
+                                 spaceBefore=10, spaceAfter=8, textColor=_C_USS_SUBHEADING),
+    'body': ParagraphStyle('Body', parent=_STYLES['Normal'], fontSize=10,
+                           spaceAfter=8, alignment=TA_JUSTIFY),
+    'note': ParagraphStyle('Note', parent=_STYLES['Normal'], fontSize=8,
+                           textColor=colors.grey, alignment=TA_LEFT),
+}
+
+# Centred cells of the USS scorecard; sizes and colours come from inline markup
+_USS_SCORE_STYLE = ParagraphStyle('USSScore', alignment=TA_CENTER)
+_USS_CLASS_STYLE = ParagraphStyle('USSClass', alignment=TA_CENTER)
+
+# Centred cells of the LULC sustainability score display
+_LULC_SCORE_STYLE = ParagraphStyle('ScoreStyle', alignment=TA_CENTER)
+_LULC_RATING_STYLE = ParagraphStyle('RatingStyle', alignment=TA_CENTER)
+
+
+_INDEX_DESCRIPTIONS = {
+    'NDVI': 'Vegetation health and density',
+    'NDWI': 'Water content in vegetation',
+    'NDBI': 'Built-up area intensity',
+    'EVI': 'Enhanced vegetation monitoring',
+    'SAVI': 'Soil-adjusted vegetation'
+}
+
+
+def _render_lulc_sustainability(elements, sustainability, styles):
+    heading_style = styles['heading']
+    note_style = styles['note']
+    
+    elements.extend((Paragraph("Land Sustainability Score", heading_style), Spacer(1, 10)))
+    
+    score = sustainability.get('score', 0)
+    rating = sustainability.get('rating', 'Unknown')
+    score_color = sustainability.get('color', '#666666')
+    
+    score_table_data = [[
+        Paragraph(f'<font size="24" color="{score_color}"><b>{score:.0f}</b></font><font size="12">/100</font>', 
+                 _LULC_SCORE_STYLE),
+        Paragraph(f'<font size="11" color="{score_color}"><b>{rating}</b></font>',
+                 _LULC_RATING_STYLE)
+    ]]
+    score_display = Table(score_table_data, colWidths=_CW_SCORE_DISPLAY)
+    score_display.setStyle(_SCORE_DISPLAY_STYLE)
+    elements.extend((score_display, Spacer(1, 15)))
+    
+    components = sustainability.get('components', {})
+    if components:
+        comp_data = [['Component', 'Value', 'Score', 'Weight']]
+        for name, comp in components.items():
+            comp_data.append([
+                _pretty(name),
+                comp.get('description', ''),
+                f"{comp.get('score', 0):.0f}/100",
+                f"{comp.get('weight', 0)}%"
+            ])
+        
+        comp_table = Table(comp_data, colWidths=_CW_LULC_COMPONENTS)
+        comp_table.setStyle(_LULC_COMPONENT_TABLE_STYLE)
+        elements.append(comp_table)
+    
+    elements.append(Spacer(1, 15))
+    method_note = """<b>Methodology:</b> The Land Sustainability Score is calculated using weighted components:
+    Green Cover (35%) - Percentage of vegetation including trees, grass, and crops;
+    Impervious Surface (25%) - Built-up and bare ground areas;
+    Water Bodies (15%) - Presence of water features;
+    Land Diversity (15%) - Number of distinct land cover classes;
+    Vegetation Trend (10%) - Change in tree cover if time-series available.
+    Scores range from 0-100, with higher scores indicating better environmental sustainability."""
+    elements.extend((Paragraph(method_note, note_style), Spacer(1, 30)))
+
+
+def _render_lulc_stats(elements, stats, styles):
+    heading_style = styles['heading']
+    
+    elements.append(Paragraph("Land Cover Statistics", heading_style))
+    
+    # Pull the class rows out once; the table, ordering and pie check
+    # then work on plain tuples.
+    stats_rows = [(name, float(data.get('area_sqkm', 0)), float(data.get('percentage', 0)))
+                  for name, data in stats.items() if isinstance(data, dict)]
+    stats_rows.sort(key=itemgetter(2), reverse=True)
+    
+    table_data = [['Land Cover Class', 'Area (km²)', 'Percentage (%)']]
+    table_data.extend([name, f"{area:.2f}", f"{pct:.1f}%"] for name, area, pct in stats_rows)
+    
+    lulc_table = Table(table_data, colWidths=_CW_LULC_CLASSES)
+    lulc_table.setStyle(_LULC_CLASS_TABLE_STYLE)
+    elements.extend((lulc_table, Spacer(1, 15)))
+    
+    # An all-zero distribution has no pie to draw.
+    if sum(pct for _, _, pct in stats_rows) > 0:
+        try:
+            chart_buf = _pie_chart_image(stats, 'Land Cover Distribution', 400, 280)
+            elements.append(_ChartImage(chart_buf, width=5*inch, height=2.8*inch))
+        except _CHART_ERRORS as e:
+            logger.warning("Land cover pie chart failed to render: %s", e)
+    elements.append(Spacer(1, 20))
+
+
+def _render_lulc_indices(elements, indices, styles):
+    heading_style = styles['heading']
+    
+    elements.append(Paragraph("Vegetation Indices Summary", heading_style))
+    
+    idx_data = [['Index', 'Mean Value', 'Description']]
+    for idx_name, idx_val in indices.items():
+        if idx_val is not None:
+            idx_data.append([
+                idx_name,
+                f"{idx_val:.4f}",
+                _INDEX_DESCRIPTIONS.get(idx_name, '')
+            ])
+    
+    if len(idx_data) > 1:
+        idx_table = Table(idx_data, colWidths=_CW_INDICES)
+        idx_table.setStyle(_INDEX_TABLE_STYLE)
+        elements.extend((idx_table, Spacer(1, 20)))
+
+
+def _render_lulc_changes(elements, change_data, styles):
+    heading_style = styles['heading']
+    body_style = styles['body']
+    
+    elements.extend((PageBreak(), Paragraph("Land Cover Change Analysis", heading_style)))
+    
+    year1 = change_data.get('year1', '')
+    year2 = change_data.get('year2', '')
+    changes = change_data.get('changes', {})
+    
+    elements.append(Paragraph(f"Comparison: {year1} to {year2}", body_style))
+    
+    change_table_data = [['Class', f'{year1} (%)', f'{year2} (%)', 'Change (%)']]
+    names = list(changes)
+    n = len(names)
+    year1_pct = np.fromiter((changes[k].get('year1_pct', 0) for k in names), dtype=np.float64, count=n)
+    year2_pct = np.fromiter((changes[k].get('year2_pct', 0) for k in names), dtype=np.float64, count=n)
+    change = np.fromiter((changes[k].get('change', 0) for k in names), dtype=np.float64, count=n)
+    order = np.argsort(-np.abs(change), kind='stable')
+    change = change[order]
+    change_strs = np.char.mod('%.1f', change)
+    change_strs = np.where(change > 0, np.char.add('+', change_strs), change_strs)
+    change_table_data.extend(
+        [names[i], y1, y2, ch]
+        for i, y1, y2, ch in zip(order.tolist(),
+                                 np.char.mod('%.1f', year1_pct[order]).tolist(),
+                                 np.char.mod('%.1f', year2_pct[order]).tolist(),
+                                 change_strs.tolist())
+    )
+    
+    change_table = Table(change_table_data, colWidths=_CW_CHANGE)
+    change_table.setStyle(_CHANGE_TABLE_STYLE)
+    elements.append(change_table)
+
+
+def _render_lulc_insights(elements, insights, styles):
+    elements.append(PageBreak())
+    styles_dict = {'Heading': styles['heading'], 'Body': styles['body']}
+    _add_insights_section(elements, styles_dict, insights)
+
+
+# Report sections in order, as (report_data key, renderer).
+_LULC_SECTIONS = (
+    ('sustainability_score', _render_lulc_sustainability),
+    ('stats', _render_lulc_stats),
+    ('indices', _render_lulc_indices),
+    ('change_analysis', _render_lulc_changes),
+    ('insights', _render_lulc_insights),
+)
+
+
+def generate_lulc_pdf_report(report_data, out_stream=None):
     try:
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch, cm
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-        
-        buffer = io.BytesIO()
+        buffer = out_stream if out_stream is not None else _PDFSink()
         doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*cm, bottomMargin=1*cm)
-        styles = getSampleStyleSheet()
         elements = []
         
-        title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=22, 
-                                      spaceAfter=20, alignment=TA_CENTER, textColor=colors.HexColor('#1565c0'))
-        subtitle_style = ParagraphStyle('Subtitle', parent=styles['Heading2'], fontSize=14, 
-                                         spaceAfter=10, alignment=TA_CENTER, textColor=colors.grey)
-        heading_style = ParagraphStyle('Heading', parent=styles['Heading2'], fontSize=14, 
-                                        spaceBefore=15, spaceAfter=10, textColor=colors.HexColor('#2e7d32'))
-        body_style = ParagraphStyle('Body', parent=styles['Normal'], fontSize=10, 
-                                     spaceAfter=8, alignment=TA_JUSTIFY)
-        note_style = ParagraphStyle('Note', parent=styles['Normal'], fontSize=8, 
-                                     textColor=colors.grey, alignment=TA_LEFT, leftIndent=20)
-        
-        elements.append(Paragraph("Land Use Land Cover Analysis Report", title_style))
-        elements.append(Paragraph("India GIS & Remote Sensing Portal", subtitle_style))
-        elements.append(Spacer(1, 20))
+        title_style = _LULC_STYLES['title']
+        subtitle_style = _LULC_STYLES['subtitle']
+        note_style = _LULC_STYLES['note']
+        
+        elements.extend((
+            Paragraph("Land Use Land Cover Analysis Report", title_style),
+            Paragraph("India GIS & Remote Sensing Portal", subtitle_style),
+            Spacer(1, 20),
+        ))
         
         city = report_data.get('city_name', 'Unknown')
         state = report_data.get('state', '')
@@ -786,493 +1491,287 @@ def generate_lulc_pdf_report(report_data):
             ['Analysis Period', date_range or str(year)],
             ['Satellite Source', satellite],
             ['Total Area', f"{total_area:.2f} km²" if total_area else 'N/A'],
-            ['Report Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
+            ['Report Generated', _timestamp()]
         ]
-        info_table = Table(info_data, colWidths=[5*cm, 12*cm])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e3f2fd')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        elements.append(info_table)
-        elements.append(Spacer(1, 25))
-        
-        sustainability = report_data.get('sustainability_score', {})
-        if sustainability:
-            elements.append(Paragraph("Land Sustainability Score", heading_style))
-            elements.append(Spacer(1, 10))
-            
-            score = sustainability.get('score', 0)
-            rating = sustainability.get('rating', 'Unknown')
-            score_color = sustainability.get('color', '#666666')
-            
-            score_table_data = [[
-                Paragraph(f'<font size="24" color="{score_color}"><b>{score:.0f}</b></font><font size="12">/100</font>', 
-                         ParagraphStyle('ScoreStyle', alignment=TA_CENTER)),
-                Paragraph(f'<font size="11" color="{score_color}"><b>{rating}</b></font>',
-                         ParagraphStyle('RatingStyle', alignment=TA_CENTER))
-            ]]
-            score_display = Table(score_table_data, colWidths=[4*cm, 10*cm])
-            score_display.setStyle(TableStyle([
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('PADDING', (0, 0), (-1, -1), 10),
-            ]))
-            elements.append(score_display)
-            elements.append(Spacer(1, 15))
-            
-            components = sustainability.get('components', {})
-            if components:
-                comp_data = [['Component', 'Value', 'Score', 'Weight']]
-                for name, comp in components.items():
-                    comp_data.append([
-                        name.replace('_', ' ').title(),
-                        comp.get('description', ''),
-                        f"{comp.get('score', 0):.0f}/100",
-                        f"{comp.get('weight', 0)}%"
-                    ])
-                
-                comp_table = Table(comp_data, colWidths=[4*cm, 5*cm, 2.5*cm, 2*cm])
-                comp_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4caf50')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('PADDING', (0, 0), (-1, -1), 6),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
-                ]))
-                elements.append(comp_table)
-            
-            elements.append(Spacer(1, 15))
-            method_note = """<b>Methodology:</b> The Land Sustainability Score is calculated using weighted components:
-            Green Cover (35%) - Percentage of vegetation including trees, grass, and crops;
-            Impervious Surface (25%) - Built-up and bare ground areas;
-            Water Bodies (15%) - Presence of water features;
-            Land Diversity (15%) - Number of distinct land cover classes;
-            Vegetation Trend (10%) - Change in tree cover if time-series available.
-            Scores range from 0-100, with higher scores indicating better environmental sustainability."""
-            elements.append(Paragraph(method_note, note_style))
-            elements.append(Spacer(1, 30))
-        
-        stats = report_data.get('stats', {})
-        if stats:
-            elements.append(Paragraph("Land Cover Statistics", heading_style))
-            
-            table_data = [['Land Cover Class', 'Area (km²)', 'Percentage (%)']]
-            for name, data in sorted(stats.items(), key=lambda x: x[1].get('percentage', 0), reverse=True):
-                if isinstance(data, dict):
-                    table_data.append([
-                        name,
-                        f"{data.get('area_sqkm', 0):.2f}",
-                        f"{data.get('percentage', 0):.1f}%"
-                    ])
-            
-            lulc_table = Table(table_data, colWidths=[6*cm, 3.5*cm, 3.5*cm])
-            lulc_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1565c0')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('PADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-            ]))
-            elements.append(lulc_table)
-            elements.append(Spacer(1, 15))
-            
-            if len(stats) > 0:
-                try:
-                    chart_buf = _create_chart_image('pie', stats, 'Land Cover Distribution', 400, 280)
-                    elements.append(Image(chart_buf, width=5*inch, height=2.8*inch))
-                except Exception:
-                    pass
-            elements.append(Spacer(1, 20))
-        
-        indices = report_data.get('indices', {})
-        if indices:
-            elements.append(Paragraph("Vegetation Indices Summary", heading_style))
-            
-            idx_data = [['Index', 'Mean Value', 'Description']]
-            idx_descriptions = {
-                'NDVI': 'Vegetation health and density',
-                'NDWI': 'Water content in vegetation',
-                'NDBI': 'Built-up area intensity',
-                'EVI': 'Enhanced vegetation monitoring',
-                'SAVI': 'Soil-adjusted vegetation'
-            }
-            for idx_name, idx_val in indices.items():
-                if idx_val is not None:
-                    idx_data.append([
-                        idx_name,
-                        f"{idx_val:.4f}",
-                        idx_descriptions.get(idx_name, '')
-                    ])
-            
-            if len(idx_data) > 1:
-                idx_table = Table(idx_data, colWidths=[3*cm, 3*cm, 11*cm])
-                idx_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8bc34a')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('PADDING', (0, 0), (-1, -1), 8),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-                ]))
-                elements.append(idx_table)
-                elements.append(Spacer(1, 20))
-        
-        change_data = report_data.get('change_analysis', {})
-        if change_data:
-            elements.append(PageBreak())
-            elements.append(Paragraph("Land Cover Change Analysis", heading_style))
-            
-            year1 = change_data.get('year1', '')
-            year2 = change_data.get('year2', '')
-            changes = change_data.get('changes', {})
-            
-            elements.append(Paragraph(f"Comparison: {year1} to {year2}", body_style))
-            
-            change_table_data = [['Class', f'{year1} (%)', f'{year2} (%)', 'Change (%)']]
-            for class_name, data in sorted(changes.items(), key=lambda x: abs(x[1].get('change', 0)), reverse=True):
-                change_val = data.get('change', 0)
-                change_str = f"+{change_val:.1f}" if change_val > 0 else f"{change_val:.1f}"
-                change_table_data.append([
-                    class_name,
-                    f"{data.get('year1_pct', 0):.1f}",
-                    f"{data.get('year2_pct', 0):.1f}",
-                    change_str
-                ])
-            
-            change_table = Table(change_table_data, colWidths=[5*cm, 3*cm, 3*cm, 3*cm])
-            change_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#ff9800')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('PADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ]))
-            change_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#ff9800')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('PADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ]))
-            elements.append(change_table)
+        info_table = Table(info_data, colWidths=_CW_INFO_WIDE)
+        info_table.setStyle(_LULC_INFO_TABLE_STYLE)
+        elements.extend((info_table, Spacer(1, 25)))
         
-        # Add Insights Section
-        insights = report_data.get('insights')
-        if insights:
-            elements.append(PageBreak())
-            styles_dict = {'Heading': heading_style, 'Body': body_style}
-            _add_insights_section(elements, styles_dict, insights)
-            
-        elements.append(Spacer(1, 30))
-        elements.append(Paragraph("—" * 40, styles['Normal']))
-        elements.append(Paragraph("Generated by India GIS & Remote Sensing Portal", note_style))
-        elements.append(Paragraph("Data Source: Google Earth Engine - Dynamic World, Sentinel-2, Landsat", note_style))
+        # Sections are rendered in report order; empty ones are skipped.
+        for key, render in _LULC_SECTIONS:
+            section_data = report_data.get(key)
+            if section_data:
+                render(elements, section_data, _LULC_STYLES)
+        
+        elements.extend(_footer(
+            note_style,
+            "Data Source: Google Earth Engine - Dynamic World, Sentinel-2, Landsat",
+        ))
         
-        doc.build(elements)
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        return pdf_data
+        return _build_pdf(doc, elements, buffer, out_stream)
         
     except Exception as e:
-        print(f"Error generating LULC PDF: {e}")
+        logger.exception("Error generating LULC PDF: %s", e)
         return None
 
 
-def generate_aqi_pdf_report(report_data):
+# Value formatting for the pollutant statistics table, dispatched on the exact
+# value type; anything not listed falls back to str().
+_STAT_FORMATTERS = {
+    float: '{:.6f}'.format,
+    np.float64: '{:.6f}'.format,
+}
+
+
+def _render_aqi_compliance(elements, compliance, styles):
+    heading_style = styles['heading']
+    body_style = styles['body']
+    note_style = styles['note']
+    
+    elements.append(Paragraph("Air Quality Index & Compliance", heading_style))
+
+    aqi_index = compliance.get('aqi_index', 0)
+    aqi_category = compliance.get('aqi_category', 'Unknown')
+    aqi_color = compliance.get('aqi_color', '#888888')
+    score = compliance.get('score', 0)
+    rating = compliance.get('rating', 'Unknown')
+
+    score_color = _SCORE_COLORS[bisect.bisect_right(_SCORE_COLOR_THRESHOLDS, score)]
+
+    aqi_score_data = [
+        ['AQI Index', 'AQI Category', 'WHO Compliance', 'Rating'],
+        [str(aqi_index), aqi_category, f"{score:.0f}/100", rating]
+    ]
+    aqi_score_table = Table(aqi_score_data, colWidths=_CW_AQI_SCORE)
+    aqi_score_table.setStyle(_AQI_SCORE_TABLE_STYLE)
+    aqi_score_table.setStyle([
+        ('TEXTCOLOR', (0, 1), (0, 1), _hex(aqi_color)),
+        ('TEXTCOLOR', (2, 1), (2, 1), _hex(score_color)),
+    ])
+    elements.extend((aqi_score_table, Spacer(1, 15)))
+
+    aqi_legend = """<b>AQI Categories:</b> Good (0-50), Satisfactory (51-100), Moderate (101-150), 
+    Poor (151-200), Very Poor (201-300), Severe (301-500)"""
+    elements.extend((Paragraph(aqi_legend, note_style), Spacer(1, 15)))
+
+    details = compliance.get('details', [])
+    if details:
+        elements.append(Paragraph("Pollutant-wise WHO Comparison (2021 Guidelines)", body_style))
+
+        # Pull each column out once, then format the numeric one in a single
+        # vectorized call rather than per-row dict lookups + f-strings.
+        pollutants = [d.get('pollutant', '') for d in details]
+        names = [d.get('name', '') for d in details]
+        units = [d.get('unit', '') for d in details]
+        who_limits = [d.get('who_limit', 0) for d in details]
+        sub_aqis = [d.get('sub_aqi', 0) for d in details]
+        statuses = [d.get('status', 'Unknown') for d in details]
+        measured = np.char.mod('%.2f', np.array([d.get('measured', 0) for d in details], dtype=np.float64))
+        
+        comp_data = [['Pollutant', 'Name', 'Measured', 'WHO Limit', 'Sub-AQI', 'Status']]
+        comp_data.extend(
+            [pollutant, name, f"{value} {unit}", f"{limit} {unit}", str(sub_aqi), status]
+            for pollutant, name, value, unit, limit, sub_aqi, status
+            in zip(pollutants, names, measured, units, who_limits, sub_aqis, statuses)
+        )
+
+        comp_table = Table(comp_data, colWidths=_CW_WHO)
+        comp_table.setStyle(_WHO_TABLE_STYLE)
+        elements.append(comp_table)
+
+    elements.append(Spacer(1, 10))
+    method_note = """<b>Methodology:</b> AQI is calculated using standard breakpoints for PM2.5 and PM10. 
+    The overall AQI is the highest sub-index. WHO Compliance Score (0-100) compares ground-level concentrations 
+    against WHO 2021 Guidelines: Excellent (≤50% of limit), Good (≤100%), Moderate (≤150%), 
+    Poor (≤200%), Very Poor (≤300%), Severe (>300%)."""
+    elements.extend((Paragraph(method_note, note_style), Spacer(1, 15)))
+
+    satellite_details = compliance.get('satellite_details', [])
+    if satellite_details:
+        elements.append(Paragraph("Satellite-based Pollutant Measurements", body_style))
+        sat_note = """<i>Note: The following pollutants are measured as atmospheric column density by Sentinel-5P 
+        satellite and cannot be directly compared to WHO ground-level concentration limits.</i>"""
+        elements.extend((Paragraph(sat_note, note_style), Spacer(1, 5)))
+
+        sat_measured = np.char.mod('%.4f', np.fromiter((d.get('measured', 0) for d in satellite_details),
+                                                         dtype=np.float64, count=len(satellite_details)))
+        sat_data = [['Pollutant', 'Name', 'Measured Value', 'Unit']]
+        sat_data.extend(
+            [d.get('pollutant', ''), d.get('name', ''), value, d.get('unit', '')]
+            for d, value in zip(satellite_details, sat_measured.tolist())
+        )
+
+        sat_table = Table(sat_data, colWidths=_CW_SATELLITE)
+        sat_table.setStyle(_SATELLITE_TABLE_STYLE)
+        elements.extend((sat_table, Spacer(1, 15)))
+
+
+def _render_aqi_pollutant_stats(elements, pollutant_stats, styles):
+    heading_style = styles['heading']
+    body_style = styles['body']
+    
+    elements.append(Paragraph("Pollutant Statistics", heading_style))
+
+    for pollutant, stats in pollutant_stats.items():
+        elements.append(Paragraph(f"<b>{pollutant}</b>", body_style))
+
+        stat_data = [['Metric', 'Value', 'Unit']]
+        unit = stats.get('unit', '')
+        for key, val in stats.items():
+            if key != 'unit' and val is not None:
+                stat_data.append([
+                    _pretty(key),
+                    _STAT_FORMATTERS.get(type(val), str)(val),
+                    unit
+                ])
+
+        stat_table = Table(stat_data, colWidths=_CW_AQI_STATS)
+        stat_table.setStyle(_AQI_STAT_TABLE_STYLE)
+        elements.extend((stat_table, Spacer(1, 10)))
+
+
+def _render_aqi_time_series(elements, time_series, styles):
+    heading_style = styles['heading']
+    body_style = styles['body']
+    note_style = styles['note']
+    
+    elements.extend((PageBreak(), Paragraph("Time Series Analysis", heading_style)))
+
+    series = [(pollutant, ts_data) for pollutant, ts_data in time_series.items() if ts_data and len(ts_data) > 0]
+    charts = _line_chart_images([(ts_data, f'{pollutant} Time Series', 450, 200) for pollutant, ts_data in series])
+
+    for (pollutant, ts_data), chart_buf in zip(series, charts):
+        elements.append(Paragraph(f"<b>{pollutant} Temporal Trend</b>", body_style))
+
+        if chart_buf is not None:
+            elements.append(_ChartImage(chart_buf, width=4.5*inch, height=2*inch))
+
+        values = np.fromiter((d['value'] if d.get('value') is not None else d['mean']
+                              for d in ts_data if d.get('value') or d.get('mean')), dtype=np.float64)
+        stats = _series_stats(values)
+        if stats is not None:
+            summary_text = "Period Average: {:.4f} | Max: {:.4f} | Min: {:.4f}".format(*stats)
+            elements.append(Paragraph(summary_text, note_style))
+        elements.append(Spacer(1, 15))
+
+
+def _render_aqi_hotspots(elements, hotspots, styles):
+    heading_style = styles['heading']
+    body_style = styles['body']
+    
+    elements.extend((
+        Paragraph("Hotspot Analysis", heading_style),
+        Paragraph(
+            "Areas where pollutant concentrations exceed the mean + 1.5 standard deviations are identified as hotspots, "
+            "indicating localized high pollution zones that may require targeted interventions.",
+            body_style
+        ),
+    ))
+
+
+def _render_aqi_insights(elements, insights, styles):
+    elements.append(PageBreak())
+    styles_dict = {'Heading': styles['heading'], 'Body': styles['body']}
+    _add_insights_section(elements, styles_dict, insights)
+
+
+# Report sections in order, as (report_data key, renderer).
+_AQI_SECTIONS = (
+    ('compliance_score', _render_aqi_compliance),
+    ('pollutant_stats', _render_aqi_pollutant_stats),
+    ('time_series', _render_aqi_time_series),
+    ('hotspots', _render_aqi_hotspots),
+    ('insights', _render_aqi_insights),
+)
+
+
+@lru_cache(maxsize=64)
+def _build_info_rows(city, state, date_range, pollutants):
+    # Rows are tuples so cached entries can't be mutated by a caller.
+    return (
+        ('Location', f"{city}, {state}" if state else city),
+        ('Analysis Period', date_range),
+        ('Pollutants Analyzed', ', '.join(pollutants) if pollutants else 'N/A'),
+    )
+
+
+def generate_aqi_pdf_report(report_data, out_stream=None):
     try:
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch, cm
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-        
-        buffer = io.BytesIO()
+        buffer = out_stream if out_stream is not None else _PDFSink()
         doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*cm, bottomMargin=1*cm)
-        styles = getSampleStyleSheet()
         elements = []
         
-        title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=22, 
-                                      spaceAfter=20, alignment=TA_CENTER, textColor=colors.HexColor('#1565c0'))
-        subtitle_style = ParagraphStyle('Subtitle', parent=styles['Heading2'], fontSize=14, 
-                                         spaceAfter=10, alignment=TA_CENTER, textColor=colors.grey)
-        heading_style = ParagraphStyle('Heading', parent=styles['Heading2'], fontSize=14, 
-                                        spaceBefore=15, spaceAfter=10, textColor=colors.HexColor('#0277bd'))
-        body_style = ParagraphStyle('Body', parent=styles['Normal'], fontSize=10, 
-                                     spaceAfter=8, alignment=TA_JUSTIFY)
-        note_style = ParagraphStyle('Note', parent=styles['Normal'], fontSize=8, 
-                                     textColor=colors.grey, alignment=TA_LEFT, leftIndent=20)
-        
-        elements.append(Paragraph("Air Quality Analysis Report", title_style))
-        elements.append(Paragraph("India GIS & Remote Sensing Portal", subtitle_style))
-        elements.append(Spacer(1, 20))
+        title_style = _AQI_STYLES['title']
+        subtitle_style = _AQI_STYLES['subtitle']
+        note_style = _AQI_STYLES['note']
+        
+        elements.extend((
+            Paragraph("Air Quality Analysis Report", title_style),
+            Paragraph("India GIS & Remote Sensing Portal", subtitle_style),
+            Spacer(1, 20),
+        ))
         
         city = report_data.get('city_name', 'Unknown')
         state = report_data.get('state', '')
         date_range = report_data.get('date_range', '')
         pollutants = report_data.get('pollutants', [])
         
-        info_data = [
-            ['Location', f"{city}, {state}" if state else city],
-            ['Analysis Period', date_range],
-            ['Pollutants Analyzed', ', '.join(pollutants) if pollutants else 'N/A'],
-            ['Report Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
-        ]
-        info_table = Table(info_data, colWidths=[4*cm, 9*cm])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e1f5fe')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ]))
-        elements.append(info_table)
-        elements.append(Spacer(1, 20))
-        
-        compliance = report_data.get('compliance_score', {})
-        if compliance:
-            elements.append(Paragraph("Air Quality Index & Compliance", heading_style))
-            
-            aqi_index = compliance.get('aqi_index', 0)
-            aqi_category = compliance.get('aqi_category', 'Unknown')
-            aqi_color = compliance.get('aqi_color', '#888888')
-            score = compliance.get('score', 0)
-            rating = compliance.get('rating', 'Unknown')
-            
-            if score >= 80:
-                score_color = '#388e3c'
-            elif score >= 60:
-                score_color = '#fbc02d'
-            elif score >= 40:
-                score_color = '#f57c00'
-            else:
-                score_color = '#d32f2f'
-            
-            aqi_score_data = [
-                ['AQI Index', 'AQI Category', 'WHO Compliance', 'Rating'],
-                [str(aqi_index), aqi_category, f"{score:.0f}/100", rating]
-            ]
-            aqi_score_table = Table(aqi_score_data, colWidths=[2.5*cm, 3.5*cm, 3.5*cm, 6.5*cm])
-            aqi_score_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1565c0')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (0, 1), 14),
-                ('FONTSIZE', (1, 1), (-1, 1), 9),
-                ('TEXTCOLOR', (0, 1), (0, 1), colors.HexColor(aqi_color)),
-                ('TEXTCOLOR', (2, 1), (2, 1), colors.HexColor(score_color)),
-                ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
-                ('PADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            elements.append(aqi_score_table)
-            elements.append(Spacer(1, 15))
-            
-            aqi_legend = """<b>AQI Categories:</b> Good (0-50), Satisfactory (51-100), Moderate (101-150), 
-            Poor (151-200), Very Poor (201-300), Severe (301-500)"""
-            elements.append(Paragraph(aqi_legend, note_style))
-            elements.append(Spacer(1, 15))
-            
-            details = compliance.get('details', [])
-            if details:
-                elements.append(Paragraph("Pollutant-wise WHO Comparison (2021 Guidelines)", body_style))
-                
-                comp_data = [['Pollutant', 'Name', 'Measured', 'WHO Limit', 'Sub-AQI', 'Status']]
-                for d in details:
-                    ratio = d.get('ratio', 0)
-                    status = d.get('status', 'Unknown')
-                    sub_aqi = d.get('sub_aqi', 0)
-                    unit = d.get('unit', '')
-                    comp_data.append([
-                        d.get('pollutant', ''),
-                        d.get('name', ''),
-                        f"{d.get('measured', 0):.2f} {unit}",
-                        f"{d.get('who_limit', 0)} {unit}",
-                        str(sub_aqi),
-                        status
-                    ])
-                
-                comp_table = Table(comp_data, colWidths=[1.8*cm, 4*cm, 3.2*cm, 2.8*cm, 1.8*cm, 2.5*cm])
-                comp_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0288d1')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('PADDING', (0, 0), (-1, -1), 5),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
-                ]))
-                elements.append(comp_table)
-            
-            elements.append(Spacer(1, 10))
-            method_note = """<b>Methodology:</b> AQI is calculated using standard breakpoints for PM2.5 and PM10. 
-            The overall AQI is the highest sub-index. WHO Compliance Score (0-100) compares ground-level concentrations 
-            against WHO 2021 Guidelines: Excellent (≤50% of limit), Good (≤100%), Moderate (≤150%), 
-            Poor (≤200%), Very Poor (≤300%), Severe (>300%)."""
-            elements.append(Paragraph(method_note, note_style))
-            elements.append(Spacer(1, 15))
-            
-            satellite_details = compliance.get('satellite_details', [])
-            if satellite_details:
-                elements.append(Paragraph("Satellite-based Pollutant Measurements", body_style))
-                sat_note = """<i>Note: The following pollutants are measured as atmospheric column density by Sentinel-5P 
-                satellite and cannot be directly compared to WHO ground-level concentration limits.</i>"""
-                elements.append(Paragraph(sat_note, note_style))
-                elements.append(Spacer(1, 5))
-                
-                sat_data = [['Pollutant', 'Name', 'Measured Value', 'Unit']]
-                for d in satellite_details:
-                    sat_data.append([
-                        d.get('pollutant', ''),
-                        d.get('name', ''),
-                        f"{d.get('measured', 0):.4f}",
-                        d.get('unit', '')
-                    ])
-                
-                sat_table = Table(sat_data, colWidths=[2.5*cm, 5*cm, 4*cm, 4*cm])
-                sat_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#78909c')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('PADDING', (0, 0), (-1, -1), 5),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
-                ]))
-                elements.append(sat_table)
-                elements.append(Spacer(1, 15))
-        
-        pollutant_stats = report_data.get('pollutant_stats', {})
-        if pollutant_stats:
-            elements.append(Paragraph("Pollutant Statistics", heading_style))
-            
-            for pollutant, stats in pollutant_stats.items():
-                elements.append(Paragraph(f"<b>{pollutant}</b>", body_style))
-                
-                stat_data = [['Metric', 'Value', 'Unit']]
-                unit = stats.get('unit', '')
-                for key, val in stats.items():
-                    if key != 'unit' and val is not None:
-                        stat_data.append([
-                            key.replace('_', ' ').title(),
-                            f"{val:.6f}" if isinstance(val, float) else str(val),
-                            unit
-                        ])
-                
-                stat_table = Table(stat_data, colWidths=[4*cm, 4*cm, 3*cm])
-                stat_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4fc3f7')),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('PADDING', (0, 0), (-1, -1), 5),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ]))
-                elements.append(stat_table)
-                elements.append(Spacer(1, 10))
-        
-        time_series = report_data.get('time_series', {})
-        if time_series:
-            elements.append(PageBreak())
-            elements.append(Paragraph("Time Series Analysis", heading_style))
-            
-            for pollutant, ts_data in time_series.items():
-                if ts_data and len(ts_data) > 0:
-                    elements.append(Paragraph(f"<b>{pollutant} Temporal Trend</b>", body_style))
-                    
-                    try:
-                        chart_buf = _create_chart_image('line', ts_data, f'{pollutant} Time Series', 450, 200)
-                        elements.append(Image(chart_buf, width=4.5*inch, height=2*inch))
-                    except Exception:
-                        pass
-                    
-                    values = [d.get('value', d.get('mean', 0)) for d in ts_data if d.get('value') or d.get('mean')]
-                    if values:
-                        summary_text = f"Period Average: {np.mean(values):.4f} | Max: {np.max(values):.4f} | Min: {np.min(values):.4f}"
-                        elements.append(Paragraph(summary_text, note_style))
-                    elements.append(Spacer(1, 15))
-        
-        hotspots = report_data.get('hotspots', {})
-        if hotspots:
-            elements.append(Paragraph("Hotspot Analysis", heading_style))
-            elements.append(Paragraph(
-                "Areas where pollutant concentrations exceed the mean + 1.5 standard deviations are identified as hotspots, "
-                "indicating localized high pollution zones that may require targeted interventions.",
-                body_style
-            ))
+        info_data = [list(row) for row in _build_info_rows(city, state, date_range, tuple(pollutants or ()))]
+        info_data.append(['Report Generated', _timestamp()])
+        info_table = Table(info_data, colWidths=_CW_INFO)
+        info_table.setStyle(_AQI_INFO_TABLE_STYLE)
+        elements.extend((info_table, Spacer(1, 20)))
         
-
+        # Sections are rendered in report order; empty ones are skipped.
+        for key, render in _AQI_SECTIONS:
+            section_data = report_data.get(key)
+            if section_data:
+                render(elements, section_data, _AQI_STYLES)
         
-        # Add Insights Section
-        insights = report_data.get('insights')
-        if insights:
-            elements.append(PageBreak())
-            styles_dict = {'Heading': heading_style, 'Body': body_style}
-            _add_insights_section(elements, styles_dict, insights)
-
-        elements.append(Spacer(1, 30))
-        elements.append(Paragraph("—" * 40, styles['Normal']))
-        elements.append(Paragraph("Generated by India GIS & Remote Sensing Portal", note_style))
-        elements.append(Paragraph("Data Source: Sentinel-5P TROPOMI via Google Earth Engine", note_style))
-        elements.append(Paragraph("Reference Standards: WHO Air Quality Guidelines 2021", note_style))
+        elements.extend(_footer(
+            note_style,
+            "Data Source: Sentinel-5P TROPOMI via Google Earth Engine",
+            "Reference Standards: WHO Air Quality Guidelines 2021",
+        ))
         
-        doc.build(elements)
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        return pdf_data
+        return _build_pdf(doc, elements, buffer, out_stream)
         
     except Exception as e:
-        print(f"Error generating AQI PDF: {e}")
+        logger.exception("Error generating AQI PDF: %s", e)
         return None
 
 
-def generate_urban_heat_pdf_report(report_data):
+@lru_cache(maxsize=4)
+def _lst_stat_mappings(time_of_day):
+    band_prefix = f"LST_{time_of_day}"
+    return (
+        (f'{band_prefix}_mean', 'Mean Temperature'),
+        (f'{band_prefix}_min', 'Minimum Temperature'),
+        (f'{band_prefix}_max', 'Maximum Temperature'),
+        (f'{band_prefix}_stdDev', 'Standard Deviation'),
+        (f'{band_prefix}_p50', 'Median Temperature'),
+        (f'{band_prefix}_p10', '10th Percentile'),
+        (f'{band_prefix}_p90', '90th Percentile'),
+    )
+
+
+def generate_urban_heat_pdf_report(report_data, out_stream=None):
     try:
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch, cm
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-        
-        buffer = io.BytesIO()
+        buffer = out_stream if out_stream is not None else _PDFSink()
         doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*cm, bottomMargin=1*cm)
-        styles = getSampleStyleSheet()
         elements = []
         
-        title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=22, 
-                                      spaceAfter=20, alignment=TA_CENTER, textColor=colors.HexColor('#d32f2f'))
-        subtitle_style = ParagraphStyle('Subtitle', parent=styles['Heading2'], fontSize=14, 
-                                         spaceAfter=10, alignment=TA_CENTER, textColor=colors.grey)
-        heading_style = ParagraphStyle('Heading', parent=styles['Heading2'], fontSize=14, 
-                                        spaceBefore=15, spaceAfter=10, textColor=colors.HexColor('#e65100'))
-        body_style = ParagraphStyle('Body', parent=styles['Normal'], fontSize=10, 
-                                     spaceAfter=8, alignment=TA_JUSTIFY)
-        note_style = ParagraphStyle('Note', parent=styles['Normal'], fontSize=8, 
-                                     textColor=colors.grey, alignment=TA_LEFT, leftIndent=20)
-        
-        elements.append(Paragraph("Urban Heat & Climate Analysis Report", title_style))
-        elements.append(Paragraph("India GIS & Remote Sensing Portal", subtitle_style))
-        elements.append(Spacer(1, 20))
+        title_style = _HEAT_STYLES['title']
+        subtitle_style = _HEAT_STYLES['subtitle']
+        heading_style = _HEAT_STYLES['heading']
+        body_style = _HEAT_STYLES['body']
+        note_style = _HEAT_STYLES['note']
+        
+        elements.extend((
+            Paragraph("Urban Heat & Climate Analysis Report", title_style),
+            Paragraph("India GIS & Remote Sensing Portal", subtitle_style),
+            Spacer(1, 20),
+        ))
         
         city = report_data.get('city_name', 'Unknown')
         state = report_data.get('state', '')
@@ -1285,18 +1784,11 @@ def generate_urban_heat_pdf_report(report_data):
             ['Analysis Period', date_range],
             ['Time of Day', f"{time_of_day}time"],
             ['Data Source', data_source],
-            ['Report Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
+            ['Report Generated', _timestamp()]
         ]
-        info_table = Table(info_data, colWidths=[4*cm, 9*cm])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ffebee')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ]))
-        elements.append(info_table)
-        elements.append(Spacer(1, 20))
+        info_table = Table(info_data, colWidths=_CW_INFO)
+        info_table.setStyle(_HEAT_INFO_TABLE_STYLE)
+        elements.extend((info_table, Spacer(1, 20)))
         
         vulnerability = report_data.get('vulnerability_score', {})
         if vulnerability:
@@ -1312,8 +1804,7 @@ def generate_urban_heat_pdf_report(report_data):
             <font size="12" color="{score_color}"><b>{rating}</b></font>
             </para>
             """
-            elements.append(Paragraph(score_text, styles['Normal']))
-            elements.append(Spacer(1, 15))
+            elements.extend((Paragraph(score_text, _STYLES['Normal']), Spacer(1, 15)))
             
             components = vulnerability.get('components', {})
             if components:
@@ -1322,22 +1813,14 @@ def generate_urban_heat_pdf_report(report_data):
                 comp_data = [['Component', 'Value', 'Score', 'Weight']]
                 for name, comp in components.items():
                     comp_data.append([
-                        name.replace('_', ' ').title(),
+                        _pretty(name),
                         comp.get('description', ''),
                         f"{comp.get('score', 0):.0f}/100",
                         f"{comp.get('weight', 0)}%"
                     ])
                 
-                comp_table = Table(comp_data, colWidths=[3.5*cm, 5*cm, 2.5*cm, 2*cm])
-                comp_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#ff5722')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('PADDING', (0, 0), (-1, -1), 6),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
-                ]))
+                comp_table = Table(comp_data, colWidths=_CW_HEAT_COMPONENTS)
+                comp_table.setStyle(_HEAT_COMPONENT_TABLE_STYLE)
                 elements.append(comp_table)
             
             elements.append(Spacer(1, 10))
@@ -1348,45 +1831,23 @@ def generate_urban_heat_pdf_report(report_data):
             Warming Trend (20%) - Rate of temperature increase per year;
             Extreme Heat Days (10%) - Percentage of days exceeding 40°C.
             Scores range from 0-100, with higher scores indicating greater heat vulnerability and risk."""
-            elements.append(Paragraph(method_note, note_style))
-            elements.append(Spacer(1, 15))
+            elements.extend((Paragraph(method_note, note_style), Spacer(1, 15)))
         
         lst_stats = report_data.get('lst_stats', {})
         if lst_stats:
             elements.append(Paragraph("Land Surface Temperature Statistics", heading_style))
             
-            time_of_day = report_data.get('time_of_day', 'Day')
-            band_prefix = f"LST_{time_of_day}"
-            
             stat_data = [['Metric', 'Value']]
-            stat_mappings = [
-                (f'{band_prefix}_mean', 'Mean Temperature'),
-                (f'{band_prefix}_min', 'Minimum Temperature'),
-                (f'{band_prefix}_max', 'Maximum Temperature'),
-                (f'{band_prefix}_stdDev', 'Standard Deviation'),
-                (f'{band_prefix}_p50', 'Median Temperature'),
-                (f'{band_prefix}_p10', '10th Percentile'),
-                (f'{band_prefix}_p90', '90th Percentile'),
-            ]
             
-            for key, label in stat_mappings:
+            for key, label in _lst_stat_mappings(time_of_day):
                 if key in lst_stats and lst_stats[key] is not None:
                     val = lst_stats[key]
                     stat_data.append([label, f"{val:.1f}°C"])
             
             if len(stat_data) > 1:
-                stat_table = Table(stat_data, colWidths=[6*cm, 4*cm])
-                stat_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#ff7043')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('PADDING', (0, 0), (-1, -1), 8),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ]))
-                elements.append(stat_table)
-                elements.append(Spacer(1, 15))
+                stat_table = Table(stat_data, colWidths=_CW_HEAT_STATS)
+                stat_table.setStyle(_HEAT_STAT_TABLE_STYLE)
+                elements.extend((stat_table, Spacer(1, 15)))
         
         uhi_stats = report_data.get('uhi_stats', {})
         if uhi_stats:
@@ -1400,14 +1861,7 @@ def generate_urban_heat_pdf_report(report_data):
             urban_mean = urban_stats.get(urban_mean_key, 0) if urban_stats else 0
             rural_mean = rural_stats.get(urban_mean_key, 0) if rural_stats else 0
             
-            if uhi_intensity >= 5:
-                uhi_severity = "Severe UHI effect - Significant urban warming"
-            elif uhi_intensity >= 3:
-                uhi_severity = "Moderate UHI effect - Noticeable urban warming"
-            elif uhi_intensity >= 1:
-                uhi_severity = "Mild UHI effect - Slight urban warming"
-            else:
-                uhi_severity = "Minimal UHI effect"
+            uhi_severity = _UHI_SEVERITIES[_ladder_index(_UHI_SEVERITY_THRESHOLDS, uhi_intensity)]
             
             uhi_data = [
                 ['UHI Intensity', f"{uhi_intensity:.1f}°C" if uhi_intensity else "N/A"],
@@ -1415,36 +1869,32 @@ def generate_urban_heat_pdf_report(report_data):
                 ['Rural Mean Temp', f"{rural_mean:.1f}°C" if rural_mean else "N/A"],
                 ['Assessment', uhi_severity]
             ]
-            uhi_table = Table(uhi_data, colWidths=[5*cm, 8*cm])
-            uhi_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('PADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ]))
-            elements.append(uhi_table)
-            elements.append(Spacer(1, 10))
-            elements.append(Paragraph(
-                "UHI intensity represents the temperature difference between urban areas and surrounding rural/vegetated areas. "
-                "Higher values indicate stronger urban heating effects.",
-                note_style
+            uhi_table = Table(uhi_data, colWidths=_CW_UHI)
+            uhi_table.setStyle(_KEY_VALUE_TABLE_STYLE)
+            elements.extend((
+                uhi_table,
+                Spacer(1, 10),
+                Paragraph(
+                    "UHI intensity represents the temperature difference between urban areas and surrounding rural/vegetated areas. "
+                    "Higher values indicate stronger urban heating effects.",
+                    note_style
+                ),
+                Spacer(1, 15),
             ))
-            elements.append(Spacer(1, 15))
         
         time_series = report_data.get('time_series', [])
         if time_series:
-            elements.append(PageBreak())
-            elements.append(Paragraph("Temperature Time Series", heading_style))
+            elements.extend((PageBreak(), Paragraph("Temperature Time Series", heading_style)))
             
-            try:
-                chart_buf = _create_chart_image('line', time_series, 'Land Surface Temperature Trend', 450, 200)
-                elements.append(Image(chart_buf, width=4.5*inch, height=2*inch))
-            except Exception:
-                pass
+            chart_buf = _line_chart_image(time_series, 'Land Surface Temperature Trend', 450, 200)
+            if chart_buf is not None:
+                elements.append(_ChartImage(chart_buf, width=4.5*inch, height=2*inch))
             
-            temps = [d.get('mean_lst', 0) for d in time_series if d.get('mean_lst')]
-            if temps:
-                summary_text = f"Average: {np.mean(temps):.1f}°C | Maximum: {np.max(temps):.1f}°C | Minimum: {np.min(temps):.1f}°C | Range: {np.max(temps) - np.min(temps):.1f}°C"
+            temps = np.fromiter((d['mean_lst'] for d in time_series if d.get('mean_lst')), dtype=np.float64)
+            stats = _series_stats(temps)
+            if stats is not None:
+                t_mean, t_max, t_min = stats
+                summary_text = f"Average: {t_mean:.1f}°C | Maximum: {t_max:.1f}°C | Minimum: {t_min:.1f}°C | Range: {t_max - t_min:.1f}°C"
                 elements.append(Paragraph(summary_text, body_style))
             elements.append(Spacer(1, 15))
         
@@ -1467,13 +1917,8 @@ def generate_urban_heat_pdf_report(report_data):
                 ['Statistical Significance', 'Significant (p<0.05)' if p_value < 0.05 else 'Not Significant']
             ]
             
-            trend_table = Table(trend_data, colWidths=[5*cm, 6*cm])
-            trend_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('PADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ]))
+            trend_table = Table(trend_data, colWidths=_CW_TREND)
+            trend_table.setStyle(_KEY_VALUE_TABLE_STYLE)
             elements.append(trend_table)
             
             if slope > 0:
@@ -1481,8 +1926,7 @@ def generate_urban_heat_pdf_report(report_data):
             else:
                 trend_interpretation = f"The area shows a cooling trend of {abs(slope):.3f}°C per year."
             
-            elements.append(Spacer(1, 10))
-            elements.append(Paragraph(trend_interpretation, body_style))
+            elements.extend((Spacer(1, 10), Paragraph(trend_interpretation, body_style)))
         
         elements.append(Spacer(1, 30))
         # Replaced hardcoded recommendations with dynamic insights
@@ -1497,56 +1941,40 @@ def generate_urban_heat_pdf_report(report_data):
             styles_dict = {'Heading': heading_style, 'Body': body_style}
             _add_insights_section(elements, styles_dict, insights)
         
-        elements.append(Spacer(1, 30))
-        elements.append(Paragraph("—" * 40, styles['Normal']))
-        elements.append(Paragraph("Generated by India GIS & Remote Sensing Portal", note_style))
-        elements.append(Paragraph("Data Source: MODIS Land Surface Temperature via Google Earth Engine", note_style))
+        elements.extend(_footer(
+            note_style,
+            "Data Source: MODIS Land Surface Temperature via Google Earth Engine",
+        ))
         
-        doc.build(elements)
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        return pdf_data
+        return _build_pdf(doc, elements, buffer, out_stream)
         
     except Exception as e:
-        print(f"Error generating Urban Heat PDF: {e}")
+        logger.exception("Error generating Urban Heat PDF: %s", e)
         return None
 
 
-def generate_pdf_report(report_data, report_type="lulc"):
-    if report_type == "lulc":
-        return generate_lulc_pdf_report(report_data)
-    elif report_type == "aqi":
-        return generate_aqi_pdf_report(report_data)
-    elif report_type == "urban_heat":
-        return generate_urban_heat_pdf_report(report_data)
-def generate_predictive_pdf_report(report_data):
+def _forecast_value(v):
+    # Current/forecast cells may hold a label instead of a number.
+    return f"{v:.2f}" if isinstance(v, (int, float)) else str(v)
+
+
+def generate_predictive_pdf_report(report_data, out_stream=None):
     try:
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch, cm
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-        
-        buffer = io.BytesIO()
+        buffer = out_stream if out_stream is not None else _PDFSink()
         doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*cm, bottomMargin=1*cm)
-        styles = getSampleStyleSheet()
         elements = []
         
-        title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=22, 
-                                      spaceAfter=20, alignment=TA_CENTER, textColor=colors.HexColor('#5e35b1'))
-        subtitle_style = ParagraphStyle('Subtitle', parent=styles['Heading2'], fontSize=14, 
-                                         spaceAfter=10, alignment=TA_CENTER, textColor=colors.grey)
-        heading_style = ParagraphStyle('Heading', parent=styles['Heading2'], fontSize=14, 
-                                        spaceBefore=15, spaceAfter=10, textColor=colors.HexColor('#673ab7'))
-        body_style = ParagraphStyle('Body', parent=styles['Normal'], fontSize=10, 
-                                     spaceAfter=8, alignment=TA_JUSTIFY)
-        note_style = ParagraphStyle('Note', parent=styles['Normal'], fontSize=8, 
-                                     textColor=colors.grey, alignment=TA_LEFT, leftIndent=20)
-        
-        elements.append(Paragraph("Predictive Analysis Report", title_style))
-        elements.append(Paragraph("India GIS & Remote Sensing Portal", subtitle_style))
-        elements.append(Spacer(1, 20))
+        title_style = _PREDICTIVE_STYLES['title']
+        subtitle_style = _PREDICTIVE_STYLES['subtitle']
+        heading_style = _PREDICTIVE_STYLES['heading']
+        body_style = _PREDICTIVE_STYLES['body']
+        note_style = _PREDICTIVE_STYLES['note']
+        
+        elements.extend((
+            Paragraph("Predictive Analysis Report", title_style),
+            Paragraph("India GIS & Remote Sensing Portal", subtitle_style),
+            Spacer(1, 20),
+        ))
         
         curr_year = report_data.get('current_year', 'N/A')
         target_year = report_data.get('target_year', 'N/A')
@@ -1555,18 +1983,11 @@ def generate_predictive_pdf_report(report_data):
         info_data = [
             ['Analysis Period', f"{curr_year} to {target_year}"],
             ['Model Confidence', f"R² = {confidence}"],
-            ['Report Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
+            ['Report Generated', _timestamp()]
         ]
-        info_table = Table(info_data, colWidths=[4*cm, 9*cm])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ede7f6')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ]))
-        elements.append(info_table)
-        elements.append(Spacer(1, 25))
+        info_table = Table(info_data, colWidths=_CW_INFO)
+        info_table.setStyle(_PREDICTIVE_INFO_TABLE_STYLE)
+        elements.extend((info_table, Spacer(1, 25)))
         
         # Metrics Table
         metrics = report_data.get('metrics', {})
@@ -1581,29 +2002,17 @@ def generate_predictive_pdf_report(report_data):
                 delta = m.get('delta', 0)
                 pct = m.get('pct', 0)
                 
-                # Format
-                def fmt(v): return f"{v:.2f}" if isinstance(v, (int, float)) else str(v)
-                
                 table_data.append([
                     var_name,
-                    fmt(curr),
-                    fmt(fut),
+                    _forecast_value(curr),
+                    _forecast_value(fut),
                     f"{delta:+.2f}",
                     f"{pct:+.1f}%"
                 ])
                 
-            metric_table = Table(table_data, colWidths=[4*cm, 3*cm, 3*cm, 3*cm, 3*cm])
-            metric_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#b39ddb')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('PADDING', (0, 0), (-1, -1), 6),
-            ]))
-            elements.append(metric_table)
-            elements.append(Spacer(1, 20))
+            metric_table = Table(table_data, colWidths=_CW_FORECAST_METRICS)
+            metric_table.setStyle(_FORECAST_METRIC_TABLE_STYLE)
+            elements.extend((metric_table, Spacer(1, 20)))
 
         # Insights Section
         insights = report_data.get('insights')
@@ -1611,97 +2020,111 @@ def generate_predictive_pdf_report(report_data):
             styles_dict = {'Heading': heading_style, 'Body': body_style}
             _add_insights_section(elements, styles_dict, insights)
             
-        elements.append(Spacer(1, 30))
-        elements.append(Paragraph("—" * 40, styles['Normal']))
-        elements.append(Paragraph("Generated by India GIS & Remote Sensing Portal", note_style))
-        elements.append(Paragraph("Disclaimer: Forecasts are based on historical trends and machine learning models. Actual values may vary.", note_style))
+        elements.extend(_footer(
+            note_style,
+            "Disclaimer: Forecasts are based on historical trends and machine learning models. Actual values may vary.",
+        ))
         
-        doc.build(elements)
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        return pdf_data
+        return _build_pdf(doc, elements, buffer, out_stream)
         
     except Exception as e:
-        print(f"Error generating Predictive PDF: {e}")
+        logger.exception("Error generating Predictive PDF: %s", e)
         return None
 
 
-def generate_pdf_report(report_data, report_type="lulc"):
-    if report_type == "lulc":
-        return generate_lulc_pdf_report(report_data)
-    elif report_type == "aqi":
-        return generate_aqi_pdf_report(report_data)
-    elif report_type == "urban_heat":
-        return generate_urban_heat_pdf_report(report_data)
-    elif report_type == "predictive":
-        return generate_predictive_pdf_report(report_data)
-    elif report_type == "sustainability":
-        return generate_sustainability_pdf_report(report_data)
-    else:
+def generate_pdf_report(report_data, report_type="lulc", out_stream=None):
+    generate = _PDF_GENERATORS.get(report_type)
+    if generate is None:
         return None
+    return generate(report_data, out_stream)
+
+
+_seismic_component_values = itemgetter('weight', 'score', 'weighted_score')
+
+# Display names for the seismic breakdown components
+_EQ_KEY_MAP = {
+    'pga': 'PGA Hazard (Ground Shaking)',
+    'zone': 'Seismic Zone Factor (IS 1893)',
+    'history': 'Historical Seismicity (Frequency)',
+    'fault': 'Fault Proximity',
+    'exposure': 'Urban Exposure (Built-up Density)'
+}
+
+# Status labels for the detailed metrics table as (thresholds, labels,
+# bisect). NDVI only moves up a label strictly above a threshold, so it
+# uses bisect_left; the others move up at the threshold itself.
+_METRIC_STATUS = {
+    'ndvi': ((0.2, 0.3), ('Poor', 'Moderate', 'Good'), bisect.bisect_left),
+    'impervious': ((0.3, 0.5), ('Low', 'Moderate', 'High'), bisect.bisect_right),
+    'aqi': ((50, 100), ('Good', 'Moderate', 'Unhealthy'), bisect.bisect_right),
+    'pm25': ((12, 35), ('Good', 'Moderate', 'Unhealthy'), bisect.bisect_right),
+    'lst': ((30, 35), ('Comfortable', 'Warm', 'Hot'), bisect.bisect_right),
+    'risk': ((0.3, 0.6), ('Low', 'Moderate', 'High'), bisect.bisect_right),
+    'eq_risk': ((40, 70), ('Low', 'Moderate', 'High'), bisect.bisect_right),
+}
+
+
+def _metric_status(metric, value):
+    thresholds, labels, find = _METRIC_STATUS[metric]
+    return labels[find(thresholds, value)]
+
 
+# Detailed metrics table rows as (label, metrics key, value format, scale,
+# unit); the impervious fraction is shown as a percentage.
+_METRIC_ROWS = (
+    ('NDVI (Vegetation Health)', 'ndvi', '{:.3f}', 1, 'index'),
+    ('Impervious Surface', 'impervious', '{:.1f}', 100, '%'),
+    ('Air Quality Index', 'aqi', '{:.0f}', 1, 'AQI'),
+    ('PM2.5 Concentration', 'pm25', '{:.1f}', 1, 'µg/m³'),
+    ('Land Surface Temperature', 'lst', '{:.1f}', 1, '°C'),
+    ('Environmental Risk Index', 'risk', '{:.2f}', 1, 'index'),
+    ('Seismic Risk Score', 'eq_risk', '{:.1f}', 1, 'Index'),
+)
 
-def generate_sustainability_pdf_report(report_data):
+
+def generate_sustainability_pdf_report(report_data, out_stream=None):
     try:
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch, cm
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-        
-        buffer = io.BytesIO()
+        buffer = out_stream if out_stream is not None else _PDFSink()
         doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*cm, bottomMargin=1*cm, 
                                 leftMargin=1.5*cm, rightMargin=1.5*cm)
-        styles = getSampleStyleSheet()
         elements = []
         
-        title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=24, 
-                                      spaceAfter=10, alignment=TA_CENTER, textColor=colors.HexColor('#1e3a5f'))
-        subtitle_style = ParagraphStyle('Subtitle', parent=styles['Heading2'], fontSize=12, 
-                                         spaceAfter=20, alignment=TA_CENTER, textColor=colors.grey)
-        heading_style = ParagraphStyle('Heading', parent=styles['Heading2'], fontSize=14, 
-                                        spaceBefore=20, spaceAfter=10, textColor=colors.HexColor('#1565c0'))
-        subheading_style = ParagraphStyle('SubHeading', parent=styles['Heading3'], fontSize=12, 
-                                           spaceBefore=10, spaceAfter=8, textColor=colors.HexColor('#2e7d32'))
-        body_style = ParagraphStyle('Body', parent=styles['Normal'], fontSize=10, 
-                                     spaceAfter=8, alignment=TA_JUSTIFY)
-        note_style = ParagraphStyle('Note', parent=styles['Normal'], fontSize=8, 
-                                     textColor=colors.grey, alignment=TA_LEFT)
+        title_style = _SUSTAINABILITY_STYLES['title']
+        subtitle_style = _SUSTAINABILITY_STYLES['subtitle']
+        heading_style = _SUSTAINABILITY_STYLES['heading']
+        subheading_style = _SUSTAINABILITY_STYLES['subheading']
+        body_style = _SUSTAINABILITY_STYLES['body']
+        note_style = _SUSTAINABILITY_STYLES['note']
         
         region_name = report_data.get('region_name', 'Unknown Region')
         year = report_data.get('year', 2024)
         scores = report_data.get('scores', {})
-        metrics = report_data.get('metrics', {})
         text_sections = report_data.get('text_sections', {})
+        eq_risk_data = report_data.get('eq_risk_data', {})
+        strongest = report_data.get('strongest_sector', 'N/A')
+        weakest = report_data.get('weakest_sector', 'N/A')
+        
+        # raw_metrics is the primary source; metrics is only the fallback
+        metrics = report_data['raw_metrics'] if 'raw_metrics' in report_data else report_data.get('metrics', {})
         
-        # Use raw_metrics as fall back if metrics is empty, or just use raw_metrics as primary
-        metrics = report_data.get('raw_metrics', report_data.get('metrics', {}))
+        elements.extend((
+            Paragraph("URBAN SUSTAINABILITY REPORT", title_style),
+            Paragraph("Comprehensive Environmental Assessment", subtitle_style),
+            Spacer(1, 10),
+        ))
         
-        elements.append(Paragraph("URBAN SUSTAINABILITY REPORT", title_style))
-        elements.append(Paragraph("Comprehensive Environmental Assessment", subtitle_style))
-        elements.append(Spacer(1, 10))
+        # One timestamp for the info table and the footer, so they agree.
+        generated_at = _timestamp()
         
         info_data = [
             ['Region', region_name],
             ['Analysis Year', str(year)],
-            ['Report Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+            ['Report Generated', generated_at],
             ['Data Sources', 'Sentinel-2, Dynamic World, ECMWF CAMS, MODIS']
         ]
-        info_table = Table(info_data, colWidths=[5*cm, 12*cm])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e3f2fd')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        elements.append(info_table)
-        elements.append(Spacer(1, 25))
-        
-        elements.append(Paragraph("URBAN SUSTAINABILITY SCORE (USS)", heading_style))
+        info_table = Table(info_data, colWidths=_CW_INFO_WIDE)
+        info_table.setStyle(_LULC_INFO_TABLE_STYLE)
+        elements.extend((info_table, Spacer(1, 25), Paragraph("URBAN SUSTAINABILITY SCORE (USS)", heading_style)))
         
         total_uss = scores.get('total_uss', 0)
         classification = scores.get('classification', 'Unknown')
@@ -1710,26 +2133,18 @@ def generate_sustainability_pdf_report(report_data):
         
         uss_data = [[
             Paragraph(f'<font size="36" color="{class_color}"><b>{total_uss:.0f}</b></font><font size="14">/100</font>', 
-                     ParagraphStyle('USSScore', alignment=TA_CENTER)),
+                     _USS_SCORE_STYLE),
             Paragraph(f'<font size="16" color="{class_color}"><b>{classification}</b></font><br/><br/>'
                      f'<font size="10">{class_desc}</font>',
-                     ParagraphStyle('USSClass', alignment=TA_CENTER))
+                     _USS_CLASS_STYLE)
         ]]
-        uss_table = Table(uss_data, colWidths=[5*cm, 12*cm])
-        uss_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 20),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ('BOX', (0, 0), (-1, -1), 2, colors.HexColor(class_color)),
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f8fafc')),
-        ]))
-        elements.append(uss_table)
-        elements.append(Spacer(1, 25))
-        
-        elements.append(Paragraph("MODULE SCORES BREAKDOWN", heading_style))
+        uss_table = Table(uss_data, colWidths=_CW_INFO_WIDE)
+        uss_table.setStyle(_USS_SCORE_TABLE_STYLE)
+        uss_table.setStyle([
+            ('BOX', (0, 0), (-1, -1), 2, _hex(class_color)),
+            ('BACKGROUND', (0, 0), (-1, -1), _C_USS_SCORE_BG),
+        ])
+        elements.extend((uss_table, Spacer(1, 25), Paragraph("MODULE SCORES BREAKDOWN", heading_style)))
         
         module_header = ['Module', 'Score', 'Grade', 'Key Metric', 'Value']
         module_rows = [module_header]
@@ -1754,58 +2169,20 @@ def generate_sustainability_pdf_report(report_data):
                 f"{metric_val:.2f}" if isinstance(metric_val, float) else str(metric_val)
             ])
         
-        module_table = Table(module_rows, colWidths=[4*cm, 2.5*cm, 2.5*cm, 3.5*cm, 3*cm])
-        module_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1565c0')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-        ]))
-        elements.append(module_table)
-        elements.append(Spacer(1, 25))
-        
-        elements.append(Paragraph("DETAILED METRICS", heading_style))
-        
-        metrics_detail = [
-            ['Metric', 'Value', 'Unit', 'Status'],
-            ['NDVI (Vegetation Health)', f"{metrics.get('ndvi', 0):.3f}", 'index', 
-             'Good' if metrics.get('ndvi', 0) > 0.3 else 'Moderate' if metrics.get('ndvi', 0) > 0.2 else 'Poor'],
-            ['Impervious Surface', f"{metrics.get('impervious', 0)*100:.1f}", '%',
-             'Low' if metrics.get('impervious', 0) < 0.3 else 'Moderate' if metrics.get('impervious', 0) < 0.5 else 'High'],
-            ['Air Quality Index', f"{metrics.get('aqi', 0):.0f}", 'AQI',
-             'Good' if metrics.get('aqi', 0) < 50 else 'Moderate' if metrics.get('aqi', 0) < 100 else 'Unhealthy'],
-            ['PM2.5 Concentration', f"{metrics.get('pm25', 0):.1f}", 'µg/m³',
-             'Good' if metrics.get('pm25', 0) < 12 else 'Moderate' if metrics.get('pm25', 0) < 35 else 'Unhealthy'],
-            ['Land Surface Temperature', f"{metrics.get('lst', 0):.1f}", '°C',
-             'Comfortable' if metrics.get('lst', 0) < 30 else 'Warm' if metrics.get('lst', 0) < 35 else 'Hot'],
-            ['Environmental Risk Index', f"{metrics.get('risk', 0):.2f}", 'index',
-             'Low' if metrics.get('risk', 0) < 0.3 else 'Moderate' if metrics.get('risk', 0) < 0.6 else 'High'],
-            ['Seismic Risk Score', f"{metrics.get('eq_risk', 0):.1f}", 'Index',
-             'Low' if metrics.get('eq_risk', 0) < 40 else 'Moderate' if metrics.get('eq_risk', 0) < 70 else 'High'],
-        ]
+        module_table = Table(module_rows, colWidths=_CW_USS_MODULES)
+        module_table.setStyle(_USS_MODULE_TABLE_STYLE)
+        elements.extend((module_table, Spacer(1, 25), Paragraph("DETAILED METRICS", heading_style)))
         
-        metrics_table = Table(metrics_detail, colWidths=[6*cm, 3*cm, 3*cm, 3.5*cm])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4caf50')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('PADDING', (0, 0), (-1, -1), 7),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-        ]))
-        elements.append(metrics_table)
-        elements.append(Spacer(1, 15))
+        metrics_detail = [['Metric', 'Value', 'Unit', 'Status']]
+        for label, key, fmt, scale, unit in _METRIC_ROWS:
+            value = metrics.get(key, 0)
+            metrics_detail.append([label, fmt.format(value * scale), unit, _metric_status(key, value)])
         
-        elements.append(PageBreak())
+        metrics_table = Table(metrics_detail, colWidths=_CW_USS_METRICS)
+        metrics_table.setStyle(_USS_METRIC_TABLE_STYLE)
+        elements.extend((metrics_table, Spacer(1, 15), PageBreak()))
         
         # --- Seismic Breakdown Section ---
-        eq_risk_data = report_data.get('eq_risk_data', {})
         if eq_risk_data and 'breakdown' in eq_risk_data:
             elements.append(Paragraph("SEISMIC SAFETY ANALYSIS", heading_style))
             
@@ -1822,92 +2199,61 @@ def generate_sustainability_pdf_report(report_data):
             The Earthquake Safety Score is derived from a detailed risk assessment model considering multiple weighted factors. 
             A lower Risk Score indicates higher Safety.
             """
-            elements.append(Paragraph(eq_intro, body_style))
-            elements.append(Spacer(1, 10))
+            elements.extend((Paragraph(eq_intro, body_style), Spacer(1, 10)))
             
             # Breakdown Table
             eq_header = ['Risk Component', 'Weight', 'Component Score', 'Weighted Score']
             eq_rows = [eq_header]
             
-            # Map keys to display names
-            key_map = {
-                'pga': 'PGA Hazard (Ground Shaking)',
-                'zone': 'Seismic Zone Factor (IS 1893)',
-                'history': 'Historical Seismicity (Frequency)',
-                'fault': 'Fault Proximity',
-                'exposure': 'Urban Exposure (Built-up Density)'
-            }
-            
             for k, v in bd.items():
-                name = key_map.get(k, k.title())
-                weight = f"{v['weight']*100:.0f}%"
-                c_score = f"{v['score']:.0f}"
-                w_score = f"{v['weighted_score']:.1f}"
-                eq_rows.append([name, weight, c_score, w_score])
+                weight, c_score, w_score = _seismic_component_values(v)
+                label = _EQ_KEY_MAP[k] if k in _EQ_KEY_MAP else k.title()
+                eq_rows.append([label, f"{weight*100:.0f}%", f"{c_score:.0f}", f"{w_score:.1f}"])
                 
             # Total Row
             eq_rows.append(['Total Seismic Risk Score', '', '', f"<b>{total_risk:.1f} / 100</b>"])
             
-            eq_table = Table(eq_rows, colWidths=[8*cm, 3*cm, 3.5*cm, 3.5*cm])
-            eq_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#607d8b')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('PADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#eceff1')),
-            ]))
-            elements.append(eq_table)
+            eq_table = Table(eq_rows, colWidths=_CW_EQUITY)
+            eq_table.setStyle(_SEISMIC_TABLE_STYLE)
             
             # Explanation of conversion
-            elements.append(Spacer(1, 10))
             conv_text = f"<b>Safety Score Contribution:</b> The Risk Score ({total_risk:.1f}) is inverted to calculate the Safety Score for the USS: <br/>" \
-                        f"Safety Score = 25 * (1 - ({total_risk:.1f} / 100)) = <b>{report_data['scores']['earthquake']['score']:.1f} / 25</b>"
-            elements.append(Paragraph(conv_text, body_style))
-            elements.append(Spacer(1, 25))
+                        f"Safety Score = 25 * (1 - ({total_risk:.1f} / 100)) = <b>{scores['earthquake']['score']:.1f} / 25</b>"
+            elements.extend((eq_table, Spacer(1, 10), Paragraph(conv_text, body_style), Spacer(1, 25)))
         
         elements.append(Paragraph("KEY FINDINGS", heading_style))
         
-        strongest = report_data.get('strongest_sector', 'N/A')
-        weakest = report_data.get('weakest_sector', 'N/A')
-        
         findings_text = f"""
         <b>Strongest Sector:</b> {strongest}<br/>
         This sector demonstrates the best performance in the sustainability assessment and can serve as a model for other areas.<br/><br/>
         <b>Weakest Sector:</b> {weakest}<br/>
         This sector requires immediate attention and targeted interventions to improve the overall sustainability score.
         """
-        elements.append(Paragraph(findings_text, body_style))
-        elements.append(Spacer(1, 15))
-        
-        elements.append(Paragraph("PRIORITY RECOMMENDATIONS", heading_style))
+        elements.extend((
+            Paragraph(findings_text, body_style),
+            Spacer(1, 15),
+            Paragraph("PRIORITY RECOMMENDATIONS", heading_style),
+        ))
         
         mitigations_full = text_sections.get('mitigations_full', {})
         priority_mitigations = mitigations_full.get(weakest, [])
         
         if priority_mitigations:
-            for i, mitigation in enumerate(priority_mitigations[:5], 1):
-                elements.append(Paragraph(f"<b>{i}.</b> {mitigation}", body_style))
+            elements.extend(Paragraph(f"<b>{i}.</b> {mitigation}", body_style)
+                            for i, mitigation in enumerate(priority_mitigations[:5], 1))
         else:
             elements.append(Paragraph("No specific recommendations available.", body_style))
         
-        elements.append(Spacer(1, 20))
-        
-        elements.append(Paragraph("IMPLEMENTATION ROADMAP", heading_style))
+        elements.extend((Spacer(1, 20), Paragraph("IMPLEMENTATION ROADMAP", heading_style)))
         
         roadmap = text_sections.get('roadmap', [])
         for phase in roadmap:
             phase_text = f"<b>{phase.get('phase', 'Phase')}</b> (Expected Gain: +{phase.get('expected_gain', 0)} USS points)"
             elements.append(Paragraph(phase_text, subheading_style))
-            for action in phase.get('actions', []):
-                elements.append(Paragraph(f"• {action}", body_style))
+            elements.extend(Paragraph(f"• {action}", body_style) for action in phase.get('actions', []))
             elements.append(Spacer(1, 10))
         
-        elements.append(Spacer(1, 20))
-        
-        elements.append(Paragraph("METHODOLOGY", heading_style))
+        elements.extend((Spacer(1, 20), Paragraph("METHODOLOGY", heading_style)))
         
         methodology_text = """
         This Urban Sustainability Score (USS) integrates satellite-derived environmental data from multiple sources:
@@ -1933,27 +2279,32 @@ def generate_sustainability_pdf_report(report_data):
         • 0-19: Critical (Urgent intervention required)<br/><br/>
         <b>Note:</b> The total raw score (max 125) is normalized to a standard 0-100 scale for final classification.
         """
-        elements.append(Paragraph(methodology_text, body_style))
-        
-        elements.append(Spacer(1, 30))
-        elements.append(Paragraph("—" * 50, styles['Normal']))
-        elements.append(Paragraph("Generated by India GIS & Remote Sensing Portal", note_style))
-        elements.append(Paragraph(f"Report Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", note_style))
-        elements.append(Spacer(1, 10))
-        elements.append(Paragraph(
-            "<b>Disclaimer:</b> This report is generated using satellite remote sensing data and automated analysis. "
-            "Results should be verified with ground-truth data for policy decisions. Data sources include "
-            "Google Earth Engine, Copernicus Climate Data Store, and NASA.", note_style))
-        
-        doc.build(elements)
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        return pdf_data
+        elements.extend((
+            Paragraph(methodology_text, body_style),
+            Spacer(1, 30),
+            Paragraph(_SEP_50, _STYLES['Normal']),
+            Paragraph("Generated by India GIS & Remote Sensing Portal", note_style),
+            Paragraph(f"Report Date: {generated_at}", note_style),
+            Spacer(1, 10),
+            Paragraph(
+                "<b>Disclaimer:</b> This report is generated using satellite remote sensing data and automated analysis. "
+                "Results should be verified with ground-truth data for policy decisions. Data sources include "
+                "Google Earth Engine, Copernicus Climate Data Store, and NASA.", note_style),
+        ))
+        
+        return _build_pdf(doc, elements, buffer, out_stream)
         
     except Exception as e:
-        print(f"Error generating Sustainability PDF: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error generating Sustainability PDF: %s", e)
         return None
 
 
+# report_type -> generator, used by generate_pdf_report. Defined last so
+# every generator above is bound.
+_PDF_GENERATORS = {
+    'lulc': generate_lulc_pdf_report,
+    'aqi': generate_aqi_pdf_report,
+    'urban_heat': generate_urban_heat_pdf_report,
+    'predictive': generate_predictive_pdf_report,
+    'sustainability': generate_sustainability_pdf_report,
+}
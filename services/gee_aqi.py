@@ -1,6 +1,12 @@
 import ee
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+# Concurrent Earth Engine requests for the correlation matrix
+CORRELATION_WORKERS = 16
+
 POLLUTANT_INFO = {
     "NO2": {
         "name":
@@ -141,6 +147,34 @@ POLLUTANT_INFO = {
 }
 
 
+# Region/date queries already known to have imagery. This check is the
+# only blocking call behind get_pollutant_image(), and the same request
+# recurs across dashboard reruns, baselines and the correlation matrix.
+# Earth Engine objects hash by their serialized graph, so equal geometries
+# share an entry. Only positive answers are kept: a range ending near today
+# can gain scenes as Sentinel-5P is ingested, and imagery never disappears.
+_IMAGERY_FOUND = {}
+_IMAGERY_FOUND_SIZE = 256
+_imagery_found_lock = threading.Lock()
+
+
+def _has_images(collection_id, geometry, start_date, end_date):
+    key = (collection_id, geometry, start_date, end_date)
+    if key in _IMAGERY_FOUND:
+        return True
+
+    collection = ee.ImageCollection(collection_id).filterBounds(
+        geometry).filterDate(start_date, end_date)
+    if collection.limit(1).size().getInfo() == 0:
+        return False
+
+    with _imagery_found_lock:
+        if len(_IMAGERY_FOUND) >= _IMAGERY_FOUND_SIZE:
+            del _IMAGERY_FOUND[next(iter(_IMAGERY_FOUND))]
+        _IMAGERY_FOUND[key] = True
+    return True
+
+
 def get_pollutant_image(geometry, pollutant, start_date, end_date):
     if pollutant not in POLLUTANT_INFO:
         return None
@@ -148,13 +182,14 @@ def get_pollutant_image(geometry, pollutant, start_date, end_date):
     info = POLLUTANT_INFO[pollutant]
 
     try:
+        if not _has_images(info["collection"], geometry, start_date,
+                           end_date):
+            return None
+
         collection = (ee.ImageCollection(
             info["collection"]).filterBounds(geometry).filterDate(
                 start_date, end_date).select(info["band"]))
 
-        if collection.size().getInfo() == 0:
-            return None
-
         image = collection.mean().clip(geometry)
 
         if info["scale_factor"] != 1:
@@ -178,7 +213,7 @@ def get_pollutant_vis_params(pollutant):
     }
 
 
-def calculate_pollutant_statistics(image, geometry, pollutant):
+def calculate_pollutant_statistics(image, geometry, pollutant, tile_scale=4):
     if pollutant not in POLLUTANT_INFO:
         return None
 
@@ -194,9 +229,10 @@ def calculate_pollutant_statistics(image, geometry, pollutant):
                                             '', True),
                                    geometry=geometry,
                                    scale=1000,
-                                   maxPixels=1e9).getInfo()
+                                   maxPixels=1e9,
+                                   tileScale=tile_scale).getInfo()
 
-        band_name = image.bandNames().get(0).getInfo()
+        band_name = info["band"]
 
         return {
             "mean": stats.get(f"{band_name}_mean", 0) or 0,
@@ -242,7 +278,7 @@ def create_smoothed_map(image, radius_meters=5000):
     return image.convolve(kernel)
 
 
-def create_hotspot_mask(image, geometry, threshold_sigma=1.5):
+def create_hotspot_mask(image, geometry, threshold_sigma=1.5, tile_scale=4):
     if image is None:
         return None
 
@@ -251,11 +287,12 @@ def create_hotspot_mask(image, geometry, threshold_sigma=1.5):
             ee.Reducer.stdDev(), '', True),
                                    geometry=geometry,
                                    scale=1000,
-                                   maxPixels=1e9)
+                                   maxPixels=1e9,
+                                   tileScale=tile_scale)
 
-        band_name = image.bandNames().get(0).getInfo()
-        mean = ee.Number(stats.get(f"{band_name}_mean"))
-        std = ee.Number(stats.get(f"{band_name}_stdDev"))
+        band_name = ee.String(image.bandNames().get(0))
+        mean = ee.Number(stats.get(band_name.cat("_mean")))
+        std = ee.Number(stats.get(band_name.cat("_stdDev")))
 
         threshold = mean.add(std.multiply(threshold_sigma))
         hotspot_mask = image.gt(threshold)
@@ -290,36 +327,53 @@ def get_pollutant_time_series(geometry,
         start = datetime.strptime(start_date, "%Y-%m-%d")
         end = datetime.strptime(end_date, "%Y-%m-%d")
 
-        time_series = []
+        windows = []
         current = start
 
         while current < end:
-            next_date = current + timedelta(days=interval_days)
-            if next_date > end:
-                next_date = end
-
-            image = get_pollutant_image(geometry, pollutant,
-                                        current.strftime("%Y-%m-%d"),
-                                        next_date.strftime("%Y-%m-%d"))
-
-            if image is not None:
-                band_name = image.bandNames().get(0).getInfo()
-                stats = image.reduceRegion(reducer=ee.Reducer.mean(),
-                                           geometry=geometry,
-                                           scale=1000,
-                                           maxPixels=1e9).getInfo()
-
-                value = stats.get(band_name, None)
-
-                time_series.append({
-                    "date": current.strftime("%Y-%m-%d"),
-                    "value": value,
-                    "pollutant": pollutant,
-                })
-
+            next_date = min(current + timedelta(days=interval_days), end)
+            windows.append([current.strftime("%Y-%m-%d"),
+                            next_date.strftime("%Y-%m-%d")])
             current = next_date
 
-        return time_series
+        if not windows:
+            return []
+
+        collection = (ee.ImageCollection(
+            info["collection"]).filterBounds(geometry).select(info["band"]))
+
+        def window_images(window):
+            window = ee.List(window)
+            images = collection.filterDate(window.get(0), window.get(1))
+            return ee.Feature(None, {
+                "date": window.get(0),
+                "end": window.get(1),
+                "has_images": images.limit(1).size(),
+            })
+
+        def window_mean(feature):
+            image = collection.filterDate(feature.get("date"),
+                                          feature.get("end")).mean()
+            if info["scale_factor"] != 1:
+                image = image.multiply(info["scale_factor"])
+            stats = image.reduceRegion(reducer=ee.Reducer.mean(),
+                                       geometry=geometry,
+                                       scale=1000,
+                                       maxPixels=1e9,
+                                       tileScale=4)
+            return feature.set("value", stats.get(info["band"]))
+
+        # Windows are averaged server-side and fetched with one getInfo();
+        # windows without imagery are dropped before averaging, as
+        # get_pollutant_image() would return None for them.
+        series = (ee.FeatureCollection(ee.List(windows).map(window_images))
+                  .filter(ee.Filter.gt("has_images", 0)).map(window_mean))
+
+        return [{
+            "date": feature["properties"]["date"],
+            "value": feature["properties"].get("value"),
+            "pollutant": pollutant,
+        } for feature in series.getInfo()["features"]]
     except Exception as e:
         print(f"Error getting time series for {pollutant}: {e}")
         return None
@@ -329,54 +383,64 @@ def calculate_rolling_average(time_series, window=7):
     if not time_series or len(time_series) < window:
         return time_series
 
-    result = []
-    values = [d["value"] for d in time_series if d["value"] is not None]
+    # Trailing mean over the last `window` samples, skipping missing ones,
+    # from prefix sums of the values and of the valid-sample counts.
+    values = np.array([np.nan if d["value"] is None else d["value"]
+                       for d in time_series],
+                      dtype=np.float64)
+    valid = ~np.isnan(values)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+
+    hi = np.arange(1, len(values) + 1)
+    lo = np.maximum(hi - window, 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        averages = (sums[hi] - sums[lo]) / (counts[hi] - counts[lo])
 
-    for i, data in enumerate(time_series):
-        if data["value"] is None:
-            result.append({**data, "rolling_avg": None})
-            continue
+    return [{
+        **data, "rolling_avg": avg if ok else None
+    } for data, avg, ok in zip(time_series, averages.tolist(), valid.tolist())]
 
-        start_idx = max(0, i - window + 1)
-        window_values = values[start_idx:i + 1]
 
-        if window_values:
-            avg = sum(window_values) / len(window_values)
-            result.append({**data, "rolling_avg": avg})
-        else:
-            result.append({**data, "rolling_avg": None})
+def _pair_correlation(img1, img2, geometry):
+    if img1 is None or img2 is None:
+        return None
 
-    return result
+    try:
+        combined = img1.addBands(img2)
+        corr = combined.reduceRegion(
+            reducer=ee.Reducer.pearsonsCorrelation(),
+            geometry=geometry,
+            scale=1000,
+            maxPixels=1e8,
+            tileScale=4).getInfo()
+
+        return corr.get("correlation", None)
+    except Exception:
+        return None
 
 
 def calculate_pollutant_correlations(geometry, pollutants, start_date,
                                      end_date):
-    correlations = {}
-
-    for p1 in pollutants:
-        for p2 in pollutants:
-            if p1 == p2:
-                correlations[(p1, p2)] = 1.0
-            elif (p2, p1) in correlations:
-                correlations[(p1, p2)] = correlations[(p2, p1)]
-            else:
-                img1 = get_pollutant_image(geometry, p1, start_date, end_date)
-                img2 = get_pollutant_image(geometry, p2, start_date, end_date)
-
-                if img1 is None or img2 is None:
-                    correlations[(p1, p2)] = None
-                    continue
-
-                try:
-                    combined = img1.addBands(img2)
-                    corr = combined.reduceRegion(
-                        reducer=ee.Reducer.pearsonsCorrelation(),
-                        geometry=geometry,
-                        scale=1000,
-                        maxPixels=1e8).getInfo()
-
-                    correlations[(p1, p2)] = corr.get("correlation", None)
-                except:
-                    correlations[(p1, p2)] = None
+    images = {
+        p: get_pollutant_image(geometry, p, start_date, end_date)
+        for p in pollutants
+    }
+    correlations = {(p, p): 1.0 for p in pollutants}
+
+    pairs = [(p1, p2) for i, p1 in enumerate(pollutants)
+             for p2 in pollutants[i + 1:]]
+    if not pairs:
+        return correlations
+
+    # Each pair is reduced over the pixels valid in both of its bands, and
+    # each reduction is an independent blocking request to Earth Engine.
+    with ThreadPoolExecutor(
+            max_workers=min(len(pairs), CORRELATION_WORKERS)) as executor:
+        values = executor.map(
+            lambda pair: _pair_correlation(images[pair[0]], images[pair[1]],
+                                           geometry), pairs)
+        for (p1, p2), value in zip(pairs, values):
+            correlations[(p1, p2)] = correlations[(p2, p1)] = value
 
     return correlations
@@ -1,10 +1,12 @@
 import ee
+import io
 import json
 import streamlit as st
 import geopandas as gpd
 import tempfile
 import os
 import zipfile
+from functools import lru_cache
 
 
 def format_gee_error(e):
@@ -54,6 +56,9 @@ def auto_initialize_gee():
             st.session_state.gee_initialized = False
 
 
+# Same city and buffer give the same geometry object, which also lets
+# downstream caches keyed on the geometry hit.
+@lru_cache(maxsize=256)
 def get_city_geometry(lat, lon, buffer_km=15):
     point = ee.Geometry.Point([lon, lat])
     buffer_meters = buffer_km * 1000
@@ -140,6 +145,17 @@ def optimize_geometry(geometry, max_vertices=5000):
         return geometry
 
 
+def _union_geometry(gdf):
+    """
+    Union of all geometries in a GeoDataFrame. GeoPandas 1.0 deprecates the
+    unary_union property in favour of union_all(); older versions only have
+    the property.
+    """
+    if hasattr(gdf, "union_all"):
+        return gdf.union_all()
+    return gdf.unary_union
+
+
 def _geometry_to_ee(geometry):
     """
     Helper to reliably convert shapely geometry to ee.Geometry
@@ -172,18 +188,29 @@ def _geometry_to_ee(geometry):
         return None, str(e)
 
 
+# Files that make up a shapefile; anything else in an uploaded .zip is skipped
+SHAPEFILE_EXTENSIONS = ('.shp', '.shx', '.dbf', '.prj', '.cpg')
+
+
 def process_shapefile_upload(uploaded_files):
     try:
         with tempfile.TemporaryDirectory() as tmpdir:
             for uploaded_file in uploaded_files:
+                if uploaded_file.name.endswith('.zip'):
+                    # Read the archive from memory and extract only the
+                    # shapefile components, rather than saving the .zip and
+                    # unpacking everything in it.
+                    with zipfile.ZipFile(io.BytesIO(uploaded_file.getbuffer()),
+                                         'r') as zip_ref:
+                        for name in zip_ref.namelist():
+                            if name.lower().endswith(SHAPEFILE_EXTENSIONS):
+                                zip_ref.extract(name, tmpdir)
+                    continue
+
                 file_path = os.path.join(tmpdir, uploaded_file.name)
                 with open(file_path, "wb") as f:
                     f.write(uploaded_file.getbuffer())
 
-                if uploaded_file.name.endswith('.zip'):
-                    with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                        zip_ref.extractall(tmpdir)
-
             shp_files = [f for f in os.listdir(tmpdir) if f.endswith('.shp')]
 
             if not shp_files:
@@ -196,8 +223,7 @@ def process_shapefile_upload(uploaded_files):
                 gdf = gdf.to_crs(epsg=4326)
 
             # Combine all features into one geometry (Union)
-            # Use unary_union which is standard for merging all geometries in a GDF
-            geometry = gdf.unary_union
+            geometry = _union_geometry(gdf)
 
             # Get centroid for map centering
             centroid = geometry.centroid
@@ -240,13 +266,13 @@ def geojson_file_to_ee_geometry(uploaded_file):
             elif gdf.crs.to_epsg() != 4326:
                 gdf = gdf.to_crs(epsg=4326)
 
-            geometry = gdf.unary_union
+            geometry = _union_geometry(gdf)
 
         elif geojson.get("type") == "Feature":
             # load as single feature gdf
             gdf = gpd.GeoDataFrame.from_features([geojson])
             if not gdf.crs: gdf.set_crs(epsg=4326, inplace=True)
-            geometry = gdf.unary_union
+            geometry = _union_geometry(gdf)
 
         else:
             # Just geometry
@@ -259,7 +285,7 @@ def geojson_file_to_ee_geometry(uploaded_file):
             }
             gdf = gpd.GeoDataFrame.from_features([feature])
             if not gdf.crs: gdf.set_crs(epsg=4326, inplace=True)
-            geometry = gdf.unary_union
+            geometry = _union_geometry(gdf)
 
         # Extract centroid
         centroid = geometry.centroid
@@ -289,12 +315,13 @@ def sample_pixel_value(image, lat, lon, scale=10):
         return None
 
 
-def get_image_mean(image, geometry, scale=30):
+def get_image_mean(image, geometry, scale=30, tile_scale=4):
     try:
         result = image.reduceRegion(reducer=ee.Reducer.mean(),
                                     geometry=geometry,
                                     scale=scale,
-                                    maxPixels=1e9).getInfo()
+                                    maxPixels=1e9,
+                                    tileScale=tile_scale).getInfo()
         return result
     except Exception as e:
         print(f"Error calculating mean: {e}")
@@ -0,0 +1,118 @@
+import math
+
+from services.exports import (
+    generate_aqi_csv,
+    generate_change_analysis_csv,
+    generate_lulc_csv,
+    generate_time_series_csv,
+)
+
+# Expected outputs were produced by the original pandas DataFrame.to_csv
+# exporters; the "# Generated" timestamp line is left out of the comparison.
+
+
+def _without_timestamp(text):
+    return "".join(line + "\n" for line in text.splitlines() if not line.startswith("# Generated"))
+
+
+def test_lulc_csv_mixed_int_and_float_columns_write_floats():
+    stats = {
+        'total_area_sqkm': 44.0,
+        'classes': {
+            'Trees': {'percentage': 30.5, 'area_sqkm': 12},
+            'Water': {'percentage': 5, 'area_sqkm': 2.5},
+            'Built Area': {'percentage': 64.5, 'area_sqkm': 30},
+        },
+    }
+
+    assert _without_timestamp(generate_lulc_csv(stats, 'Delhi', 2023)) == (
+        "# LULC Statistics Report\n# Location: Delhi\n# Year: 2023\n# Total Area: 44.0 km²\n#\n"
+        "Class,Area (km²),Percentage (%)\n"
+        "Built Area,30.0,64.5\n"
+        "Trees,12.0,30.5\n"
+        "Water,2.5,5.0\n"
+    )
+
+
+def test_lulc_csv_all_int_columns_stay_int():
+    stats = {'classes': {'Trees': {'percentage': 60, 'area_sqkm': 12}, 'Water': {'percentage': 40, 'area_sqkm': 8}}}
+
+    assert _without_timestamp(generate_lulc_csv(stats, 'Delhi', 2023)) == (
+        "# LULC Statistics Report\n# Location: Delhi\n# Year: 2023\n# Total Area: N/A km²\n#\n"
+        "Class,Area (km²),Percentage (%)\n"
+        "Trees,12,60\n"
+        "Water,8,40\n"
+    )
+
+
+def test_time_series_csv_missing_and_nan_cells_are_empty():
+    time_series = [
+        {'date': '2023-01-01', 'value': 10, 'pollutant': 'NO2'},
+        {'date': '2023-01-08', 'value': 12.5, 'pollutant': 'NO2', 'rolling_avg': 11.25},
+        {'date': '2023-01-15', 'value': None, 'pollutant': 'NO2', 'rolling_avg': None},
+        {'date': '2023-01-22', 'value': math.nan, 'pollutant': 'NO2'},
+    ]
+
+    assert _without_timestamp(generate_time_series_csv(time_series, 'NO2', 'Delhi')) == (
+        "# Time Series Data - NO2\n# Location: Delhi\n#\n"
+        "date,value,pollutant,rolling_avg\n"
+        "2023-01-01,10.0,NO2,\n"
+        "2023-01-08,12.5,NO2,11.25\n"
+        "2023-01-15,,NO2,\n"
+        "2023-01-22,,NO2,\n"
+    )
+
+
+def test_time_series_csv_all_int_values_stay_int():
+    time_series = [{'date': '2023-01-01', 'value': 10}, {'date': '2023-01-08', 'value': 12}]
+
+    assert _without_timestamp(generate_time_series_csv(time_series, 'NO2', 'Delhi')) == (
+        "# Time Series Data - NO2\n# Location: Delhi\n#\n"
+        "date,value\n"
+        "2023-01-01,10\n"
+        "2023-01-08,12\n"
+    )
+
+
+_TREES_WATER = {'classes': {'Trees': {'percentage': 30, 'area_sqkm': 12}, 'Water': {'percentage': 5, 'area_sqkm': 2}}}
+
+
+def test_change_analysis_csv_int_columns_stay_int():
+    later = {'classes': {'Trees': {'percentage': 25, 'area_sqkm': 10}, 'Crops': {'percentage': 10, 'area_sqkm': 4}}}
+
+    assert _without_timestamp(generate_change_analysis_csv(_TREES_WATER, later, 2020, 2023, 'Delhi')) == (
+        "# LULC Change Analysis Report\n# Location: Delhi\n# Period: 2020 to 2023\n#\n"
+        "Class,2020 Area (km²),2023 Area (km²),Change (km²),2020 (%),2023 (%),Change (%)\n"
+        "Crops,0,4,4,0,10,10\n"
+        "Trees,12,10,-2,30,25,-5\n"
+        "Water,2,0,-2,5,0,-5\n"
+    )
+
+
+def test_change_analysis_csv_types_each_column_separately():
+    later = {'classes': {'Trees': {'percentage': 25.5, 'area_sqkm': 10}}}
+
+    assert _without_timestamp(generate_change_analysis_csv(_TREES_WATER, later, 2020, 2023, 'Delhi')) == (
+        "# LULC Change Analysis Report\n# Location: Delhi\n# Period: 2020 to 2023\n#\n"
+        "Class,2020 Area (km²),2023 Area (km²),Change (km²),2020 (%),2023 (%),Change (%)\n"
+        "Water,2,0,-2,5,0.0,-5.0\n"
+        "Trees,12,10,-2,30,25.5,-4.5\n"
+    )
+
+
+def test_aqi_csv_formats_mean_to_four_places():
+    stats = {'mean': 45.25, 'max': 90, 'count': 10, 'unit': 'µg/m³'}
+
+    assert _without_timestamp(generate_aqi_csv(stats, 'PM2.5', 'Delhi', '2023')) == (
+        "# AQI Statistics Report - PM2.5\n# Location: Delhi\n# Date Range: 2023\n#\n"
+        "Statistic,Value,Unit\n"
+        "Mean,45.2500,µg/m³\n"
+        "Max,90,µg/m³\n"
+        "Count,10,µg/m³\n"
+    )
+
+
+def test_csv_exports_without_stats_return_none():
+    assert generate_lulc_csv({}) is None
+    assert generate_change_analysis_csv({}, _TREES_WATER, 2020, 2023) is None
+    assert generate_aqi_csv({}, 'PM2.5') is None
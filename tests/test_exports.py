@@ -0,0 +1,163 @@
+import math
+
+import pytest
+
+from services.exports import (
+    WHO_STANDARDS_2021,
+    calculate_aqi_compliance_score,
+    calculate_heat_vulnerability_score,
+    calculate_land_sustainability_score,
+    calculate_sub_aqi,
+    get_aqi_category,
+)
+
+# Expected values were produced by the original if/elif ladders and the
+# linear breakpoint scan they were replaced with.
+
+
+def _component_scores(result):
+    return {name: component['score'] for name, component in result['components'].items()}
+
+
+def test_heat_vulnerability_nan_mean_temperature_scores_lowest_bucket():
+    result = calculate_heat_vulnerability_score({'mean_celsius': math.nan})
+
+    assert _component_scores(result) == {'temperature': 0}
+    assert result['score'] == 0
+    assert result['rating'] == "Very Low Vulnerability"
+
+
+def test_heat_vulnerability_nan_inputs_score_lowest_buckets():
+    result = calculate_heat_vulnerability_score(
+        {'mean_celsius': math.nan, 'max_celsius': math.nan},
+        uhi_stats={'mean': math.nan},
+        warming_trend={'slope_per_year': math.nan},
+    )
+
+    assert _component_scores(result) == {'temperature': 0, 'uhi': 0, 'variability': 20, 'warming_trend': 20}
+    assert result['score'] == 7.8
+
+
+def test_heat_vulnerability_nan_uhi_and_trend_with_finite_mean():
+    result = calculate_heat_vulnerability_score(
+        {'mean_celsius': 30},
+        uhi_stats={'mean': math.nan},
+        warming_trend={'slope_per_year': math.nan},
+    )
+
+    assert _component_scores(result) == {'temperature': 40, 'uhi': 0, 'warming_trend': 20}
+    assert result['score'] == 21.3
+
+
+def test_heat_vulnerability_missing_mean_temperature():
+    result = calculate_heat_vulnerability_score({'mean': None})
+
+    assert result['components'] == {}
+    assert result['score'] == 0
+
+
+def test_heat_vulnerability_scores_finite_inputs():
+    result = calculate_heat_vulnerability_score(
+        {'mean_celsius': 45, 'max_celsius': 60},
+        uhi_stats={'mean': 6},
+        warming_trend={'slope_per_year': 0.6},
+    )
+
+    assert _component_scores(result) == {'temperature': 100, 'uhi': 80, 'variability': 80, 'warming_trend': 100}
+    assert result['rating'] == "Very High Vulnerability"
+
+
+@pytest.mark.parametrize("mean, max_temp, uhi, slope, components, score, rating", [
+    (25, 30, 1, 0, {'temperature': 20, 'uhi': 20, 'variability': 40, 'warming_trend': 40}, 27.8, "Low Vulnerability"),
+    (30, 45, 2, 0.1, {'temperature': 40, 'uhi': 40, 'variability': 80, 'warming_trend': 60}, 51.1,
+     "Moderate Vulnerability"),
+    (24.9, 40, 0.5, -0.2, {'temperature': 0, 'uhi': 0, 'variability': 80, 'warming_trend': 20}, 17.8,
+     "Very Low Vulnerability"),
+])
+def test_heat_vulnerability_threshold_boundaries(mean, max_temp, uhi, slope, components, score, rating):
+    result = calculate_heat_vulnerability_score(
+        {'mean_celsius': mean, 'max_celsius': max_temp},
+        uhi_stats={'mean': uhi},
+        warming_trend={'slope_per_year': slope},
+    )
+
+    assert _component_scores(result) == components
+    assert result['score'] == score
+    assert result['rating'] == rating
+
+
+def test_heat_vulnerability_extreme_heat_share():
+    time_series = [{'date': month, 'mean_lst': 30 + month} for month in range(1, 13)]
+    result = calculate_heat_vulnerability_score(
+        {'mean_celsius': 38, 'max_celsius': 50}, {'mean': 3}, time_series, {'slope_per_year': 0.2})
+
+    assert _component_scores(result) == {
+        'temperature': 60, 'uhi': 40, 'variability': 60, 'warming_trend': 60, 'extreme_heat': 80}
+    assert result['score'] == 57.0
+
+
+@pytest.mark.parametrize("aqi, category", [
+    (0, "Good"), (50, "Good"), (50.5, "Satisfactory"), (100, "Satisfactory"), (101, "Moderate"),
+    (150, "Moderate"), (200, "Poor"), (300, "Very Poor"), (301, "Severe"), (math.inf, "Severe"), (math.nan, "Severe"),
+])
+def test_aqi_category_boundaries(aqi, category):
+    assert get_aqi_category(aqi)[0] == category
+
+
+@pytest.mark.parametrize("pollutant, concentration, sub_aqi", [
+    ('PM2.5', -1, 0), ('PM2.5', 0, 0), ('PM2.5', 12.05, 0), ('PM2.5', 15, 57), ('PM2.5', 30.5, 90),
+    ('PM2.5', 60, 153), ('PM2.5', 250, 300), ('PM2.5', 251, 301), ('PM2.5', 300, 340), ('PM2.5', 1000, 500),
+    ('PM2.5', math.nan, 0), ('PM10', 54, 50), ('PM10', 54.5, 0), ('PM10', 55, 51), ('PM10', 156, 101),
+])
+def test_sub_aqi_matches_breakpoint_scan(pollutant, concentration, sub_aqi):
+    breakpoints = WHO_STANDARDS_2021[pollutant]['aqi_breakpoints']
+
+    assert calculate_sub_aqi(concentration, breakpoints) == sub_aqi
+
+
+@pytest.mark.parametrize("pollutant_stats, score, rating, aqi_index, category", [
+    ({'PM2.5': {'mean': 30}, 'NO2': {'mean': 80}}, 40.0, "Poor - Significant Exceedances", 89, "Satisfactory"),
+    ({'PM2.5': {'mean': 15}, 'PM10': {'mean': 45}}, 80.0, "Good - Meets WHO Guidelines", 57, "Satisfactory"),
+    ({'PM2.5': {'mean': 120}, 'SO2': {'mean': None}, 'Aerosol': {'mean': 0.2}}, 0.0,
+     "Severe - Critical Pollution Levels", 184, "Poor"),
+    ({'PM2.5': {'mean': math.nan}}, 0.0, "Severe - Critical Pollution Levels", 0, "Good"),
+    ({'CO': {'mean': 0.03}}, 0, "N/A - No comparable pollutants", 0, "Good"),
+])
+def test_aqi_compliance_score(pollutant_stats, score, rating, aqi_index, category):
+    result = calculate_aqi_compliance_score(pollutant_stats)
+
+    assert (result['score'], result['rating'], result['aqi_index'], result['aqi_category']) == (
+        score, rating, aqi_index, category)
+
+
+def test_aqi_compliance_ratio_bands():
+    result = calculate_aqi_compliance_score({'PM2.5': {'mean': 30}, 'PM10': {'mean': 45}})
+
+    assert [(d['pollutant'], d['score'], d['sub_aqi'], d['status']) for d in result['details']] == [
+        ('PM2.5', 40, 89, "Poor"), ('PM10', 80, 42, "Good")]
+
+
+def _classes(**percentages):
+    return {'classes': {name.replace('_', ' '): {'percentage': pct} for name, pct in percentages.items()}}
+
+
+@pytest.mark.parametrize("lulc_stats, change_stats, components, score, rating", [
+    (_classes(Trees=30, Water=3, Crops=20, Rangeland=10), {'Trees': {'change': -2}},
+     {'green_cover': 100, 'impervious': 100, 'water': 60, 'diversity': 60, 'vegetation_trend': 40}, 82.0,
+     "Excellent Sustainability"),
+    (_classes(Trees=math.nan, Water=5), None,
+     {'green_cover': 0, 'impervious': 100, 'water': 80, 'diversity': 20}, 44.4, "Moderate Sustainability"),
+    (_classes(Trees=30, Built_Area=math.nan), None,
+     {'green_cover': 60, 'impervious': 0, 'water': 20, 'diversity': 20}, 30.0, "Poor Sustainability"),
+    (_classes(Trees=30, Water=math.nan), None,
+     {'green_cover': 60, 'impervious': 100, 'water': 20, 'diversity': 20}, 57.8, "Moderate Sustainability"),
+    (_classes(Trees=30), {'Trees': {'change': math.nan}},
+     {'green_cover': 60, 'impervious': 100, 'water': 20, 'diversity': 20, 'vegetation_trend': 10}, 53.0,
+     "Moderate Sustainability"),
+])
+def test_land_sustainability_score(lulc_stats, change_stats, components, score, rating):
+    result = calculate_land_sustainability_score(lulc_stats, change_stats)
+
+    assert _component_scores(result) == components
+    assert result['score'] == score
+    assert result['rating'] == rating
@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("ee")
+
+from services.gee_aqi import calculate_rolling_average
+
+
+def _series(*values):
+    return [{'date': f'2023-01-{day:02d}', 'value': value} for day, value in enumerate(values, start=1)]
+
+
+def test_rolling_average_matches_window_loop():
+    # Expected values come from the original per-sample window slicing.
+    result = calculate_rolling_average(_series(3, 5, 4, 8, 10, 6, 2, 9), window=3)
+
+    assert [d['rolling_avg'] for d in result] == pytest.approx(
+        [3.0, 4.0, 4.0, 17 / 3, 22 / 3, 8.0, 6.0, 17 / 3])
+
+
+def test_rolling_average_default_window_with_floats():
+    result = calculate_rolling_average(_series(1.5, 2.5, 0.1, 0.2, 0.7, 9.9, 4.4, 3.3))
+
+    assert [d['rolling_avg'] for d in result] == pytest.approx(
+        [1.5, 2.0, 1.3666666666666665, 1.075, 1.0, 2.4833333333333334, 2.757142857142857, 3.0142857142857147])
+
+
+def test_rolling_average_skips_missing_samples_by_position():
+    result = calculate_rolling_average(_series(1, None, 3, 5), window=2)
+
+    assert [d['rolling_avg'] for d in result] == [1.0, None, 3.0, 4.0]
+    assert [d['value'] for d in result] == [1, None, 3, 5]
+
+
+def test_rolling_average_short_series_is_returned_unchanged():
+    series = _series(1, 2)
+
+    assert calculate_rolling_average(series, window=3) is series
+    assert calculate_rolling_average([]) == []
@@ -0,0 +1,125 @@
+import io
+
+import pytest
+
+from services.exports import (
+    calculate_aqi_compliance_score,
+    calculate_heat_vulnerability_score,
+    calculate_land_sustainability_score,
+    generate_pdf_report,
+)
+
+_INSIGHTS = {
+    'key_findings': ['Finding'],
+    'root_causes': ['Cause'],
+    'mitigation_actions': ['Action'],
+    'future_risks': 'Risk',
+    'rules_used': ['Rule'],
+}
+
+_CLASSES = {
+    'Trees': {'percentage': 30.5, 'area_sqkm': 12.0},
+    'Water': {'percentage': 5.0, 'area_sqkm': 2.0},
+    'Built Area': {'percentage': 64.5, 'area_sqkm': 30.0},
+}
+
+_POLLUTANT_STATS = {
+    'PM2.5': {'mean': 45.2, 'max': 90.1, 'count': 10, 'unit': 'µg/m³'},
+    'NO2': {'mean': 0.0001, 'unit': 'mol/m²'},
+}
+
+_HEAT_SERIES = [{'date': f'2023-{month:02d}', 'mean_lst': 30 + month} for month in range(1, 13)]
+
+_REPORTS = {
+    'lulc': {
+        'city_name': 'Delhi', 'state': 'DL', 'year': 2023, 'satellite': 'S2', 'total_area': 44.0,
+        'sustainability_score': calculate_land_sustainability_score({'classes': _CLASSES}, {'Trees': {'change': 2}}),
+        'stats': _CLASSES,
+        'indices': {'NDVI': 0.3, 'EVI': None},
+        'change_analysis': {'year1': 2020, 'year2': 2023, 'changes': {
+            'Trees': {'change': -2, 'year1_pct': 30, 'year2_pct': 28},
+            'Water': {'change': 3, 'year1_pct': 2, 'year2_pct': 5},
+        }},
+        'insights': _INSIGHTS,
+    },
+    'aqi': {
+        'city_name': 'Delhi', 'state': 'DL', 'date_range': '2023', 'pollutants': ['PM2.5', 'NO2'],
+        'compliance_score': calculate_aqi_compliance_score(_POLLUTANT_STATS),
+        'pollutant_stats': _POLLUTANT_STATS,
+        'time_series': {'PM2.5': [{'date': f'2023-{month:02d}', 'value': month * 1.5} for month in range(1, 13)],
+                        'NO2': []},
+        'hotspots': {'count': 1},
+        'insights': _INSIGHTS,
+    },
+    'urban_heat': {
+        'city_name': 'Delhi', 'state': 'DL', 'date_range': '2023', 'time_of_day': 'Day',
+        'vulnerability_score': calculate_heat_vulnerability_score(
+            {'mean_celsius': 38, 'max_celsius': 50}, {'mean': 3}, _HEAT_SERIES, {'slope_per_year': 0.2}),
+        'lst_stats': {'LST_Day_mean': 38.0, 'LST_Day_max': 50.0, 'LST_Day_p50': None},
+        'uhi_stats': {'uhi_intensity': 3.2, 'urban_stats': {'LST_Day_mean': 39.0},
+                      'rural_stats': {'LST_Day_mean': 35.8}},
+        'time_series': _HEAT_SERIES,
+        'warming_trend': {'slope_per_year': 0.05, 'total_change': 0.5, 'r_squared': 0.4, 'p_value': 0.01,
+                          'start_year': 2015, 'end_year': 2023},
+        'insights': _INSIGHTS,
+    },
+    'predictive': {
+        'current_year': 2023, 'target_year': 2030, 'confidence': 0.8,
+        'metrics': {'NDVI': {'current': 0.3, 'future': 0.25, 'delta': -0.05, 'pct': -16.0}},
+        'insights': _INSIGHTS,
+    },
+    'sustainability': {
+        'region_name': 'Delhi', 'year': 2023,
+        'scores': {
+            'total_uss': 55, 'classification': 'Moderate', 'class_color': '#fbc02d', 'class_desc': 'Moderate',
+            'vegetation': {'score': 12.0, 'grade': 'B'}, 'aqi': {'score': 10.0, 'grade': 'C'},
+            'heat': {'score': 8, 'grade': 'D'}, 'prediction': {'score': 15.0, 'grade': 'B'},
+            'earthquake': {'score': 18.5, 'grade': 'A'},
+        },
+        'raw_metrics': {'ndvi': 0.25, 'impervious': 0.4, 'aqi': 120, 'pm25': 40.0, 'lst': 33.0, 'risk': 0.5,
+                        'eq_risk': 26.0},
+        'eq_risk_data': {'total_score': 26.0, 'risk_class': 'Low', 'breakdown': {
+            'pga': {'weight': 0.3, 'score': 40, 'weighted_score': 12.0},
+        }},
+        'zone_info': {'zone': 'IV'},
+        'hazard_stats': {'mean_pga': 0.24},
+        'strongest_sector': 'Vegetation',
+        'weakest_sector': 'Urban Heat',
+        'text_sections': {
+            'mitigations_full': {'Urban Heat': ['Cool roofs']},
+            'roadmap': [{'phase': 'Phase 1', 'expected_gain': 5, 'actions': ['Plant trees']}],
+        },
+    },
+}
+
+
+@pytest.mark.parametrize("report_type", sorted(_REPORTS))
+def test_pdf_report_builds(report_type):
+    pdf = generate_pdf_report(_REPORTS[report_type], report_type)
+
+    assert pdf.startswith(b"%PDF")
+    assert pdf.rstrip().endswith(b"%%EOF")
+
+
+@pytest.mark.parametrize("report_type", sorted(_REPORTS))
+def test_pdf_report_writes_to_stream(report_type):
+    out_stream = io.BytesIO()
+
+    assert generate_pdf_report(_REPORTS[report_type], report_type, out_stream=out_stream) is True
+    assert out_stream.getvalue().startswith(b"%PDF")
+
+
+def test_pdf_report_survives_malformed_chart_data():
+    report = dict(_REPORTS['lulc'], stats=dict(_CLASSES, Unknown=5))
+
+    assert generate_pdf_report(report, 'lulc').startswith(b"%PDF")
+
+
+def test_pdf_report_without_pollutant_list():
+    report = dict(_REPORTS['aqi'], pollutants=None)
+
+    assert generate_pdf_report(report, 'aqi').startswith(b"%PDF")
+
+
+def test_unknown_report_type():
+    assert generate_pdf_report({}, 'unknown') is None